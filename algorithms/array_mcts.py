@@ -0,0 +1,222 @@
+"""Monte Carlo Tree Search over a struct-of-arrays tree.
+
+Same search as `mcts.py`, but the node fields live in NumPy columns indexed
+by node id instead of one Python object per node. All children of a node are
+allocated together in a contiguous id range, so UCB1 selection is a single
+vectorized expression over a slice.
+"""
+import math
+import random
+import sys
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from games.game_state import GameState
+from .search_algorithm import SearchAlgorithm
+
+_random = random.random
+
+class MCTSTree:
+    """Search tree stored as parallel arrays; node 0 is the root.
+
+    Game states stay Python objects and are created lazily, the first time
+    search reaches a node.
+    """
+    _COLUMNS = ("parent", "visits", "q", "first_child", "num_children")
+
+    def __init__(self, root_state: GameState, capacity: int = 1024) -> None:
+        self.parent = np.zeros(capacity, dtype=np.int32)
+        self.visits = np.zeros(capacity, dtype=np.int32)
+        self.q = np.zeros(capacity, dtype=np.int32)          # wins - losses for player 1
+        self.first_child = np.zeros(capacity, dtype=np.int32)
+        self.num_children = np.zeros(capacity, dtype=np.int32)
+        self.first_child[0] = -1 # -1: not expanded yet
+        self.parent[0] = -1
+        self.states: List[Optional[GameState]] = [root_state]
+        self.actions: List[Optional[Tuple]] = [None] # action leading to each node
+        self.n_nodes = 1
+
+    def _reserve(self, needed: int) -> None:
+        """Grow every column (doubling) to hold at least *needed* nodes."""
+        capacity = len(self.visits)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, 2 * capacity)
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, name, new)
+
+    def state(self, node: int) -> GameState:
+        state = self.states[node]
+        if state is None:
+            parent_state = self.state(int(self.parent[node]))
+            state = self.states[node] = parent_state.move_unchecked(self.actions[node])
+        return state
+
+    def expand(self, node: int) -> None:
+        """Allocate a contiguous block of (unvisited) children for *node*."""
+        actions = self.state(node).available_actions()
+        start, count = self.n_nodes, len(actions)
+        end = start + count
+        self._reserve(end)
+        self.parent[start:end] = node
+        self.first_child[start:end] = -1
+        self.first_child[node] = start
+        self.num_children[node] = count
+        self.states.extend([None] * count)
+        self.actions.extend(actions)
+        self.n_nodes = end
+
+    def best_child(self, node: int, c_param: float = math.sqrt(2)) -> int:
+        """Return the child of *node* with the highest UCB1 score."""
+        start = int(self.first_child[node])
+        children = slice(start, start + int(self.num_children[node]))
+        visits = self.visits[children]
+        unvisited = np.flatnonzero(visits == 0)
+        if unvisited.size:
+            return start + int(unvisited[0]) # explore unvisited children first
+        player = self.state(node).current_player
+        inv_n = 1.0 / visits
+        ucb = self.q[children] * player * inv_n + c_param * np.sqrt(math.log(self.visits[node]) * inv_n)
+        return start + int(np.argmax(ucb))
+
+    def subtree(self, node: int) -> "MCTSTree":
+        """Copy the subtree under *node* into a new tree rooted at it.
+
+        Child blocks are copied whole, breadth first, so they stay
+        contiguous in the new tree.
+        """
+        tree = MCTSTree(self.state(node), capacity=max(1024, self.n_nodes))
+        tree.visits[0] = self.visits[node]
+        tree.q[0] = self.q[node]
+        pending = [(node, 0)]
+        for old, new in pending: # grows while iterating
+            start = int(self.first_child[old])
+            if start < 0:
+                continue
+            count = int(self.num_children[old])
+            new_start = tree.n_nodes
+            old_block = slice(start, start + count)
+            new_block = slice(new_start, new_start + count)
+            tree.parent[new_block] = new
+            tree.visits[new_block] = self.visits[old_block]
+            tree.q[new_block] = self.q[old_block]
+            tree.first_child[new_block] = -1
+            tree.first_child[new] = new_start
+            tree.num_children[new] = count
+            tree.states.extend(self.states[old_block])
+            tree.actions.extend(self.actions[old_block])
+            tree.n_nodes = new_start + count
+            pending.extend((start + i, new_start + i) for i in range(count))
+        return tree
+
+    def find(self, state: GameState, max_plies: int = 2) -> Optional[int]:
+        """Id of a node for *state* at most *max_plies* below the root, if any."""
+        frontier = [0]
+        for _ in range(max_plies):
+            frontier = [
+                child
+                for node in frontier if self.first_child[node] >= 0
+                for child in range(int(self.first_child[node]),
+                                   int(self.first_child[node] + self.num_children[node]))
+            ]
+            for node in frontier:
+                # Nodes without a state were never visited; nothing to keep.
+                known = self.states[node]
+                if known is not None and known == state:
+                    return node
+        return None
+
+    def backpropagate(self, path: List[int], result: int) -> None:
+        ids = np.array(path, dtype=np.int32) # a tree path never repeats a node
+        self.visits[ids] += 1
+        self.q[ids] += result
+
+def _playout(state: GameState) -> int:
+    """Play uniformly random moves from *state* and return the result."""
+    result = state.fast_rollout()
+    if result is not None:
+        return result
+    status = state.game_status()
+    while status is None:
+        actions = state.available_actions()
+        if not actions:
+            return 0
+        state = state.move_unchecked(actions[int(_random() * len(actions))])
+        status = state.game_status()
+    return status
+
+class ArrayMCTSAlgorithm(SearchAlgorithm):
+    """MCTS using the struct-of-arrays `MCTSTree`."""
+    def __init__(self, simulations_per_move: int = 200, reuse_tree: bool = True, **kwargs) -> None:
+        super().__init__(**kwargs)
+        if simulations_per_move <= 0:
+             raise ValueError("Simulations per move must be positive.")
+        self.simulations_per_move = simulations_per_move
+        # Keep the tree between moves and continue from the subtree of the
+        # position actually reached, as MCTSAlgorithm does.
+        self.reuse_tree = reuse_tree
+        self._tree: Optional[MCTSTree] = None
+
+    def next_action(self, state: GameState) -> Tuple:
+        if state.is_game_over():
+            raise ValueError("next_action called on a terminal state")
+        available_actions = state.available_actions()
+        if not available_actions:
+            raise RuntimeError("No available actions from the root state.")
+        book = state.book_move()
+        if book is not None:
+            return book
+
+        tree = self._reuse_tree(state) if self.reuse_tree else None
+        if tree is None:
+            tree = MCTSTree(state)
+        if len(available_actions) == 1: # forced move: nothing to search
+            if self.reuse_tree:
+                self._tree = tree
+            return available_actions[0]
+        for _ in range(self.simulations_per_move):
+            # Selection & expansion: descend until a terminal or new node.
+            node = 0
+            path = [0]
+            while True:
+                if tree.state(node).is_game_over():
+                    break
+                if tree.first_child[node] < 0:
+                    tree.expand(node)
+                    if tree.num_children[node] == 0:
+                        break
+                child = tree.best_child(node)
+                path.append(child)
+                node = child
+                if tree.visits[child] == 0:
+                    break
+            tree.backpropagate(path, _playout(tree.state(node)))
+
+        # Robust child: the most visited root move
+        start = int(tree.first_child[0])
+        if start < 0:
+            print("Warning: MCTS root was not expanded, returning first available action.", file=sys.stderr)
+            return available_actions[0]
+        best = start + int(np.argmax(tree.visits[start:start + int(tree.num_children[0])]))
+        action = tree.actions[best]
+        if action is None:
+            raise RuntimeError("Best child node has no action.")
+        if self.reuse_tree:
+            self._tree = tree
+        return action
+
+    def _reuse_tree(self, state: GameState) -> Optional[MCTSTree]:
+        """Subtree of the previous search's tree for *state*, if it has one.
+
+        *state* is looked for one and two plies below the old root (after our
+        move, and after the opponent's reply).
+        """
+        old, self._tree = self._tree, None
+        if old is None:
+            return None
+        node = old.find(state)
+        return old.subtree(node) if node is not None else None
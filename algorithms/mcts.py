@@ -1,93 +1,367 @@
 import math
+import multiprocessing
+import os
 import random
 import sys
-from collections import defaultdict
-from typing import List, Optional, Sequence, Tuple, cast
-
-import numpy as np
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, ClassVar, Dict, Hashable, List, Optional, Sequence, Tuple, cast
 
 # Updated imports for new structure
 from games.game_state import GameState # Import from games package
 from .search_algorithm import SearchAlgorithm # Relative import
 
+_random = random.random # module-level alias avoids an attribute lookup per rollout ply
+
+_POOL_LIMIT = 1 << 16 # max released nodes kept for reuse
+
+class TranspositionTable(Dict[Hashable, 'MonteCarloTreeSearchNode']):
+    """Search-wide map from position to node.
+
+    With *symmetric* set, positions are keyed by `GameState.canonical_key`,
+    so symmetric positions share a node as well as exact repeats.
+    """
+    def __init__(self, symmetric: bool = False) -> None:
+        super().__init__()
+        self.symmetric = symmetric
+
+    def key(self, state: GameState) -> Hashable:
+        return state.canonical_key() if self.symmetric else state
+
 class MonteCarloTreeSearchNode:
     """A node in the (game) search tree for Monte Carlo Tree Search.
 
     Works with GameState where Action is Tuple.
     """
-    def __init__(self, state: GameState, parent: Optional['MonteCarloTreeSearchNode'] = None, parent_action: Optional[Tuple] = None) -> None:
+    # Trees grow to many thousands of nodes; slots avoid a per-node __dict__.
+    __slots__ = (
+        "state", "parent", "parent_action", "children",
+        "_number_of_visits", "_inv_n", "_wins", "_losses", "_untried_actions",
+        "_transpositions",
+    )
+
+    # Free list of released nodes, recycled by `_new` to cut allocation and GC
+    # churn. Each subclass gets its own list (see __init_subclass__).
+    _pool: ClassVar[List['MonteCarloTreeSearchNode']] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+
+    @classmethod
+    def _new(cls, state: GameState, parent: Optional['MonteCarloTreeSearchNode'] = None, parent_action: Optional[Tuple] = None,
+             transpositions: Optional[TranspositionTable] = None) -> 'MonteCarloTreeSearchNode':
+        """Construct a node, reusing a released instance when one is available."""
+        node = cls._pool.pop() if cls._pool else cls.__new__(cls)
+        node.__init__(state, parent, parent_action, transpositions) # type: ignore[misc]
+        return node
+
+    def __init__(self, state: GameState, parent: Optional['MonteCarloTreeSearchNode'] = None, parent_action: Optional[Tuple] = None,
+                 transpositions: Optional[TranspositionTable] = None) -> None:
         self.state: GameState = state
         self.parent: Optional['MonteCarloTreeSearchNode'] = parent
         self.parent_action: Optional[Tuple] = parent_action
-        self.children: List['MonteCarloTreeSearchNode'] = []
+        # A list while expanding; frozen to a tuple once fully expanded
+        self.children: Sequence['MonteCarloTreeSearchNode'] = []
         self._number_of_visits: int = 0
-        self._results: defaultdict[int, int] = defaultdict(int)
-        self._results[1] = 0
-        self._results[-1] = 0
+        # 1 / visits, kept up to date with the visit count so that selection,
+        # which reads it for every child, multiplies instead of dividing.
+        self._inv_n: float = 0.0
+        self._wins: int = 0   # simulations won by player 1
+        self._losses: int = 0 # simulations won by player -1
+        # Draws only count as visits: they add nothing to q().
         self._untried_actions: Optional[List[Tuple]] = None
+        # Search-wide map from state to node, shared by every node of one tree.
+        # When set, a position reached by another move order reuses its node
+        # (and statistics) instead of growing a duplicate subtree.
+        self._transpositions: Optional[TranspositionTable] = transpositions
 
     def get_untried_actions(self) -> List[Tuple]:
         # cache the available actions, pop them one by one as the evaluation progresses
         if self._untried_actions is None:
-            self._untried_actions = self.state.available_actions()
+            # copy: states may return a cached sequence that must not be mutated
+            self._untried_actions = list(self.state.available_actions())
         return self._untried_actions
 
     def q(self) -> int:
-        wins = self._results[1]
-        losses = self._results[-1]
-        return wins - losses
+        return self._wins - self._losses
 
     def n(self) -> int:
         return self._number_of_visits
 
     def expand(self) -> 'MonteCarloTreeSearchNode':
         untried = self.get_untried_actions()
+        # Expand in random order, so that ties among unvisited children do
+        # not always favor the game's last listed move: swap a random entry
+        # to the end and pop it, as a lazy shuffle.
+        i = int(_random() * len(untried))
+        untried[i], untried[-1] = untried[-1], untried[i]
         action: Tuple = untried.pop()
-        next_state = self.state.move(action)
-        child_node = self.__class__(next_state, parent=self, parent_action=action)
-        self.children.append(child_node)
+        next_state = self.state.move_unchecked(action)
+        transpositions = self._transpositions
+        children = cast(List['MonteCarloTreeSearchNode'], self.children)
+        if transpositions is None:
+            child_node = self._new(next_state, parent=self, parent_action=action)
+            children.append(child_node)
+        else:
+            key = transpositions.key(next_state)
+            existing = transpositions.get(key)
+            if existing is not None:
+                next_state.release() # duplicate of the shared node's state
+                child_node = existing
+                # Symmetric sibling moves reach the same node; list it once.
+                if child_node not in children:
+                    children.append(child_node)
+            else:
+                child_node = self._new(next_state, self, action, transpositions)
+                transpositions[key] = child_node
+                children.append(child_node)
+        if not untried:
+            # No more children will be added: drop the list's over-allocation.
+            self.children = tuple(children)
         return child_node
 
+    def release(self, keep: Optional[Dict[int, 'MonteCarloTreeSearchNode']] = None) -> None:
+        """Return this node and its subtree to the free lists for reuse.
+
+        The states of descendant nodes are released as well; this node's own
+        state is left alone since it may be owned by the caller. Nodes in
+        *keep* (keyed by id) and everything below them are skipped. Nothing
+        else in the subtree may be used afterwards.
+        """
+        pool_limit = _POOL_LIMIT
+        stack: List['MonteCarloTreeSearchNode'] = [self]
+        # with transpositions a node can be reached more than once
+        seen = set(keep) if keep else set()
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            stack.extend(node.children)
+            if node is not self:
+                node.state.release()
+            node.parent = None
+            node.children = ()
+            node._untried_actions = None
+            node._transpositions = None
+            pool = node._pool
+            if len(pool) < pool_limit:
+                pool.append(node)
+
+    def subtree(self) -> Dict[int, 'MonteCarloTreeSearchNode']:
+        """Return every node reachable from this one, keyed by id."""
+        nodes: Dict[int, 'MonteCarloTreeSearchNode'] = {}
+        stack: List['MonteCarloTreeSearchNode'] = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) not in nodes:
+                nodes[id(node)] = node
+                stack.extend(node.children)
+        return nodes
+
+    def action_to(self, child: 'MonteCarloTreeSearchNode') -> Tuple:
+        """Return the action leading from this node to *child*.
+
+        A child shared through the transposition table may have been created
+        by another parent, in which case its `parent_action` belongs to that
+        parent and the action is found by replaying the legal moves.
+        """
+        if child.parent is self and child.parent_action is not None:
+            return child.parent_action
+        transpositions = self._transpositions
+        target = transpositions.key(child.state) if transpositions is not None else child.state
+        for action in self.state.available_actions():
+            next_state = self.state.move_unchecked(action)
+            key = transpositions.key(next_state) if transpositions is not None else next_state
+            if key == target:
+                return action
+        raise RuntimeError("Child node is not reachable from its parent.")
+
     def is_terminal_node(self) -> bool:
         return self.state.is_game_over()
 
     def rollout(self) -> int:
         current_rollout_state = self.state
-        while not current_rollout_state.is_game_over():
-            possible_moves: List[Tuple] = current_rollout_state.available_actions()
+        uniform = type(self).rollout_policy is _uniform_rollout_policy
+        if uniform:
+            # The uniform policy can run entirely in compiled code if the game
+            # provides it (Numba for Sudo Tic-Tac-Toe).
+            result = current_rollout_state.fast_rollout()
+            if result is not None:
+                return result
+        # Games that support it play the whole simulation on one scratch copy
+        # instead of allocating a new state per ply.
+        in_place = current_rollout_state.supports_inplace_moves
+        if in_place:
+            current_rollout_state = current_rollout_state.clone()
+        # The default uniform pick is inlined below to save a method call per
+        # ply; overridden policies are bound once and called every ply.
+        rollout_policy = None if uniform else self.rollout_policy
+        rand = _random
+        status = current_rollout_state.game_status()
+        while status is None:
+            possible_moves: Sequence[Tuple] = current_rollout_state.available_actions()
             if not possible_moves:
-                return 0
-            action: Tuple = self.rollout_policy(possible_moves)
-            current_rollout_state = current_rollout_state.move(action)
-        return current_rollout_state.game_result()
+                status = 0
+                break
+            if rollout_policy is None:
+                action: Tuple = possible_moves[int(rand() * len(possible_moves))]
+            else:
+                action = rollout_policy(possible_moves)
+            if in_place:
+                current_rollout_state.apply_inplace(action)
+            else:
+                current_rollout_state = current_rollout_state.move_unchecked(action)
+            status = current_rollout_state.game_status()
+        if in_place:
+            current_rollout_state.release()
+        return status
 
     def rollout_policy(self, possible_moves: Sequence[Tuple]) -> Tuple:
-        return random.choice(possible_moves)
-
-    def backpropagate(self, result: int) -> None:
-        self._number_of_visits += 1
-        # The result is always from Player 1's perspective (1, -1, 0)
-        # We need to record it based on which player *won* or *lost*.
-        # MCTS typically stores wins/losses for the player whose turn it *was* at the parent.
-        # The backpropagation needs the result relative to the player who *made the move* into this node.
-        # Since self.parent.state.current_player made the move, we check if the result matches that player.
-        # However, the current _results defaultdict directly uses 1 and -1 keys. Let's keep that structure.
-        # A positive q() favors player 1, negative favors player -1.
-        # result=1 means player 1 won, result=-1 means player -1 won.
-        # We simply add the result to the corresponding key.
-        if result != 0: # Don't record draws in the win/loss counts
-            self._results[result] += 1
+        # Uniform pick by scaling random(); cheaper than random.choice, which
+        # goes through _randbelow's getrandbits rejection loop.
+        return possible_moves[int(_random() * len(possible_moves))]
+
+    @staticmethod
+    def _count_results(results: Sequence[int]) -> Tuple[int, int, int]:
+        """Tally playout results into (wins, losses, draws) for player 1."""
+        wins = losses = 0
+        for result in results:
+            if result == 1:
+                wins += 1
+            elif result == -1:
+                losses += 1
+        return wins, losses, len(results) - wins - losses
+
+    @staticmethod
+    def _virtual_loss(path: Sequence['MonteCarloTreeSearchNode'], amount: int) -> None:
+        """Add (or with a negative *amount*, remove) a virtual loss on *path*.
 
-        if self.parent:
-            # Backpropagate the same result (always from P1's perspective)
-            self.parent.backpropagate(result)
+        Each node below the root counts a pending visit lost by the player who
+        chose it, steering other descents of the same batch elsewhere.
+        """
+        root = path[0]
+        root._number_of_visits += amount
+        root._inv_n = 1.0 / root._number_of_visits if root._number_of_visits else 0.0
+        for i in range(1, len(path)):
+            node = path[i]
+            node._number_of_visits += amount
+            node._inv_n = 1.0 / node._number_of_visits if node._number_of_visits else 0.0
+            if path[i - 1].state.current_player == 1:
+                node._losses += amount
+            else:
+                node._wins += amount
+
+    def _batched_simulations(self, simulations_number: int, leaf_batch: int, rollouts_per_leaf: int) -> None:
+        """Run simulations with batched playouts (leaf parallelization).
+
+        Each round selects *leaf_batch* leaves, using virtual loss to spread
+        the descents, scores every leaf with *rollouts_per_leaf* playouts in
+        one `rollout_batch` call (vectorized with NumPy for Sudo Tic-Tac-Toe)
+        and then backpropagates. *simulations_number* counts playouts and
+        is rounded up to a whole number of leaves.
+        """
+        # Leaves still to select; the last round may be smaller than a batch.
+        leaves_left = max(1, -(-simulations_number // rollouts_per_leaf))
+        while leaves_left > 0:
+            batch = min(leaf_batch, leaves_left)
+            leaves_left -= batch
+            paths: List[List['MonteCarloTreeSearchNode']] = []
+            playout_states: List[GameState] = []
+            for _ in range(batch):
+                path: List['MonteCarloTreeSearchNode'] = []
+                leaf = self._tree_policy(path)
+                self._virtual_loss(path, 1)
+                paths.append(path)
+                if not leaf.is_terminal_node():
+                    playout_states.extend([leaf.state] * rollouts_per_leaf)
+            results = self.state.rollout_batch(playout_states) if playout_states else ()
+            offset = 0
+            for path in paths:
+                self._virtual_loss(path, -1)
+                leaf = path[-1]
+                if leaf.is_terminal_node():
+                    leaf_results: Sequence[int] = [leaf.state.game_result()] * rollouts_per_leaf
+                else:
+                    leaf_results = results[offset:offset + rollouts_per_leaf]
+                    offset += rollouts_per_leaf
+                leaf.backpropagate_many(*self._count_results(leaf_results), path)
+
+    def _threaded_simulations(self, simulations_number: int, threads: int) -> None:
+        """Run simulations on one shared tree from several threads.
+
+        Selection, expansion and backpropagation happen under one tree lock;
+        only the rollout runs unlocked, so threads overlap when the game's
+        rollout releases the GIL (the Numba kernel for Sudo Tic-Tac-Toe).
+        Selected paths carry a virtual loss until their result is recorded.
+        """
+        lock = threading.Lock()
+        remaining = [simulations_number]
+
+        def worker() -> None:
+            while True:
+                with lock:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                    path: List['MonteCarloTreeSearchNode'] = []
+                    leaf = self._tree_policy(path)
+                    self._virtual_loss(path, 1)
+                reward = leaf.rollout()
+                with lock:
+                    self._virtual_loss(path, -1)
+                    leaf.backpropagate(reward, path)
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = [executor.submit(worker) for _ in range(threads)]
+            for future in futures:
+                future.result() # re-raise worker errors
+
+    def backpropagate_many(self, wins: int, losses: int, draws: int,
+                           path: Sequence['MonteCarloTreeSearchNode']) -> None:
+        """Record the outcome counts of a batch of simulations along *path*."""
+        visits = wins + losses + draws
+        for node in path:
+            node._number_of_visits += visits
+            node._inv_n = 1.0 / node._number_of_visits
+            node._wins += wins
+            node._losses += losses
+
+    def backpropagate(self, result: int, path: Optional[Sequence['MonteCarloTreeSearchNode']] = None) -> None:
+        """Record a simulation result on this node and the nodes above it.
+
+        *path* lists the nodes the simulation descended through; it is
+        required when transpositions are enabled, since a shared node's
+        parent chain need not be the path that was taken. By default the
+        parent chain is walked.
+        """
+        # The result is always from Player 1's perspective (1, -1, 0).
+        # A positive q() favors player 1, negative favors player -1.
+        # Walk up to the root iteratively rather than recursing per level.
+        if path is None:
+            chain: List['MonteCarloTreeSearchNode'] = []
+            node: Optional['MonteCarloTreeSearchNode'] = self
+            while node is not None:
+                chain.append(node)
+                node = node.parent
+            path = chain
+        for node in path:
+            node._number_of_visits += 1
+            node._inv_n = 1.0 / node._number_of_visits
+            if result == 1:
+                node._wins += 1
+            elif result == -1:
+                node._losses += 1
 
     def is_fully_expanded(self) -> bool:
         return len(self.get_untried_actions()) == 0
 
     def best_child(self, c_param: float = math.sqrt(2)) -> 'MonteCarloTreeSearchNode':
         """Selects the child node with the highest UCB1 score."""
-        if self.n() == 0:
+        parent_n = self._number_of_visits
+        if parent_n == 0:
             # This can happen if the node was just expanded and hasn't been visited via backpropagation yet.
             # In standard MCTS, the parent node's visit count (N) should be available.
             # If the root node (parent=None) has n=0, it means no simulations ran, which is handled in best_action.
@@ -97,15 +371,18 @@ class MonteCarloTreeSearchNode:
             # For now, raise error as it indicates an unusual state or potential issue in the MCTS loop.
             raise ValueError("best_child called on node with zero visits. Ensure backpropagation occurs.")
 
-        log_N = math.log(self.n()) # Total visits to the parent node (self)
+        # c * sqrt(log N / n) == (c * sqrt(log N)) * sqrt(1 / n): hoist the parent part.
+        exploration_scale = c_param * math.sqrt(math.log(parent_n))
+        player = self.state.current_player
+        sqrt = math.sqrt # local binding: this loop is the hottest part of selection
         best_score = -float('inf')
         best_node: Optional['MonteCarloTreeSearchNode'] = None
 
         for child in self.children:
-            child_n = child.n() # Visits to the child node
-            if child_n == 0:
-                # Prioritize exploring unvisited children
-                ucb_score = float('inf')
+            inv_n = child._inv_n # 1 / visits to the child node
+            if inv_n == 0.0:
+                # Prioritize exploring unvisited children; none can score higher
+                return child
             else:
                 # Exploitation term: Average reward from the child node's perspective.
                 # child.q() = wins(P1) - losses(P1) = wins(P1) - wins(P-1)
@@ -113,10 +390,10 @@ class MonteCarloTreeSearchNode:
                 # If self is P1 (maximizer), use child.q() directly.
                 # If self is P-1 (minimizer), use -child.q().
                 # This is equivalent to child.q() * self.state.current_player.
-                exploitation_score = child.q() * self.state.current_player / child_n
+                exploitation_score = (child._wins - child._losses) * player * inv_n
 
                 # Exploration term (Standard UCB1)
-                exploration_score = c_param * math.sqrt(log_N / child_n)
+                exploration_score = exploration_scale * sqrt(inv_n)
 
                 ucb_score = exploitation_score + exploration_score
 
@@ -130,32 +407,46 @@ class MonteCarloTreeSearchNode:
 
         return best_node
 
-    def _tree_policy(self) -> 'MonteCarloTreeSearchNode':
+    def _tree_policy(self, path: List['MonteCarloTreeSearchNode']) -> 'MonteCarloTreeSearchNode':
+        """Select and expand a leaf, appending every node visited to *path*."""
         current_node = self
+        path.append(current_node)
         while not current_node.is_terminal_node():
             if not current_node.is_fully_expanded():
-                return current_node.expand()
+                current_node = current_node.expand()
+                path.append(current_node)
+                return current_node
             else:
                 if not current_node.children:
                     return current_node
                 current_node = current_node.best_child()
+                path.append(current_node)
         return current_node
 
-    def best_action(self, simulations_number: int = 200) -> Tuple:
+    def best_action(self, simulations_number: int = 200, rollouts_per_leaf: int = 1, leaf_batch: int = 1,
+                    threads: int = 1) -> Tuple:
         if self.is_terminal_node():
              raise ValueError("best_action called on a terminal node")
         available_actions = self.state.available_actions()
         if not available_actions:
              raise RuntimeError("No available actions from the root state.")
+        if len(available_actions) == 1:
+            return available_actions[0] # forced move: nothing to search
         if simulations_number <= 0:
              print("Warning: MCTS best_action called with 0 simulations, returning random action.", file=sys.stderr)
              return random.choice(available_actions)
 
         # Perform MCTS simulations
-        for _ in range(simulations_number):
-            v = self._tree_policy() # Selection & Expansion
-            reward = v.rollout()   # Simulation
-            v.backpropagate(reward) # Backpropagation
+        if threads > 1:
+            self._threaded_simulations(simulations_number, threads)
+        elif rollouts_per_leaf > 1 or leaf_batch > 1:
+            self._batched_simulations(simulations_number, leaf_batch, rollouts_per_leaf)
+        else:
+            for _ in range(simulations_number):
+                path: List['MonteCarloTreeSearchNode'] = []
+                v = self._tree_policy(path) # Selection & Expansion
+                reward = v.rollout()   # Simulation
+                v.backpropagate(reward, path) # Backpropagation
 
         # After simulations, choose the best move based on visit count
         if not self.children:
@@ -167,20 +458,169 @@ class MonteCarloTreeSearchNode:
         # Select the child node corresponding to the most visited action
         # note that we use robust child criterion for the best node after simulations instead of UCB
         best = max(self.children, key=lambda node: node.n())
-        if best.parent_action is None:
-            # This should be impossible if the node is a child created by expand()
-            raise RuntimeError("Best child node has no parent action.")
-        return best.parent_action
+        return self.action_to(best)
+
+_uniform_rollout_policy = MonteCarloTreeSearchNode.rollout_policy
 
 class MCTSAlgorithm(SearchAlgorithm):
     """Wraps the MonteCarloTreeSearchNode's search logic."""
-    def __init__(self, simulations_per_move: int = 200, **kwargs) -> None:
+    def __init__(self, simulations_per_move: int = 200, use_transpositions: bool = True,
+                 rollouts_per_leaf: int = 1, use_symmetries: bool = False, reuse_tree: bool = True,
+                 leaf_batch: int = 1, workers: Optional[int] = 1, threads: int = 1, **kwargs) -> None:
         super().__init__(**kwargs)
         if simulations_per_move <= 0:
              raise ValueError("Simulations per move must be positive.")
+        if rollouts_per_leaf <= 0:
+             raise ValueError("Rollouts per leaf must be positive.")
+        if leaf_batch <= 0:
+             raise ValueError("Leaf batch size must be positive.")
+        if threads <= 0:
+             raise ValueError("Number of threads must be positive.")
+        if threads > 1 and (leaf_batch > 1 or rollouts_per_leaf > 1):
+             raise ValueError("Threaded search cannot be combined with batched rollouts.")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+             raise ValueError("Number of workers must be positive or None.")
         self.simulations_per_move = simulations_per_move
+        # Playouts run per selected leaf; above 1 they go through the game's
+        # batched `rollout_batch` (vectorized with NumPy for Sudo Tic-Tac-Toe).
+        self.rollouts_per_leaf = rollouts_per_leaf
+        # Leaves selected (under virtual loss) before their playouts are run
+        # together in one batch.
+        self.leaf_batch = leaf_batch
+        # Share one node per position within a search (keyed by the state's
+        # __hash__/__eq__, i.e. its Zobrist hash for Sudo Tic-Tac-Toe).
+        self.use_transpositions = use_transpositions
+        # Also merge positions that are symmetric images of each other.
+        self.use_symmetries = use_symmetries
+        # Keep the tree between moves and continue from the subtree of the
+        # position actually reached, so earlier simulations are not wasted.
+        self.reuse_tree = reuse_tree
+        self._root: Optional[MonteCarloTreeSearchNode] = None
+        # Root parallelization: with several workers, independent searches
+        # run in separate processes and their root visit counts are summed.
+        # The default is a single in-process search; workers=None uses one
+        # worker per CPU. Workers are spawned, so scripts using
+        # them need an `if __name__ == "__main__":` guard; call `close` (or use
+        # the algorithm as a context manager) to stop them.
+        self.workers = workers
+        # Tree parallelization: threads share one tree, spread apart by
+        # virtual loss.
+        self.threads = threads
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _new_root(self, state: GameState) -> MonteCarloTreeSearchNode:
+        transpositions: Optional[TranspositionTable] = (
+            TranspositionTable(self.use_symmetries) if self.use_transpositions else None
+        )
+        return MonteCarloTreeSearchNode._new(state, transpositions=transpositions)
 
     def next_action(self, state: GameState) -> Tuple:
         """Uses the MonteCarloTreeSearchNode's best_action method."""
-        root = MonteCarloTreeSearchNode(state=state)
-        return root.best_action(simulations_number=self.simulations_per_move)
\ No newline at end of file
+        book = state.book_move()
+        if book is not None:
+            return book
+        if self.workers > 1 and len(state.available_actions()) > 1:
+            return self._parallel_action(state)
+        root = self._reuse_root(state) if self.reuse_tree else None
+        if root is None:
+            root = self._new_root(state)
+        action = root.best_action(simulations_number=self.simulations_per_move,
+                                  rollouts_per_leaf=self.rollouts_per_leaf,
+                                  leaf_batch=self.leaf_batch,
+                                  threads=self.threads)
+        if self.reuse_tree:
+            self._root = root
+        else:
+            root.release() # recycle the tree's nodes and states for the next search
+        return action
+
+    def _reuse_root(self, state: GameState) -> Optional[MonteCarloTreeSearchNode]:
+        """Detach the subtree for *state* from the previous search's tree.
+
+        *state* is looked for one and two plies below the old root (after our
+        move, and after the opponent's reply). The rest of the old tree is
+        released. Returns None if the position is not in the tree.
+        """
+        old_root, self._root = self._root, None
+        if old_root is None:
+            return None
+        match: Optional[MonteCarloTreeSearchNode] = None
+        frontier: List[MonteCarloTreeSearchNode] = [old_root]
+        for _ in range(2):
+            frontier = [child for node in frontier for child in node.children]
+            match = next((node for node in frontier if node.state == state), None)
+            if match is not None:
+                break
+        if match is None:
+            old_root.release()
+            return None
+
+        kept = match.subtree()
+        transpositions = old_root._transpositions
+        old_root.release(keep=kept)
+        if transpositions is not None:
+            transpositions.clear()
+        for node in kept.values():
+            # Drop links into the released part of the tree.
+            if node.parent is not None and id(node.parent) not in kept:
+                node.parent = None
+            if transpositions is not None:
+                transpositions[transpositions.key(node.state)] = node
+        return match
+
+    def _parallel_action(self, state: GameState) -> Tuple:
+        """Split the simulations over `workers` processes and vote by visits."""
+        if self._executor is None:
+            # Spawn rather than fork: forking after Numba's thread pool has
+            # started (e.g. by a batched search) can deadlock the children.
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        # Spread the budget so the workers' simulations add up to it exactly;
+        # with fewer simulations than workers, some workers sit out.
+        workers = min(self.workers, self.simulations_per_move)
+        share, extra = divmod(self.simulations_per_move, workers)
+        options = [
+            dict(
+                simulations_per_move=share + (i < extra),
+                use_transpositions=self.use_transpositions,
+                rollouts_per_leaf=self.rollouts_per_leaf,
+                use_symmetries=self.use_symmetries,
+                leaf_batch=self.leaf_batch,
+                threads=self.threads,
+            )
+            for i in range(workers)
+        ]
+        seeds = [random.getrandbits(32) for _ in range(workers)]
+        totals: Counter = Counter()
+        for visits in self._executor.map(_root_search, [state] * workers, seeds, options):
+            totals.update(visits)
+        if not totals:
+            return state.available_actions()[0]
+        return totals.most_common(1)[0][0]
+
+    def close(self) -> None:
+        """Shut down the worker processes of root-parallel search, if started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'MCTSAlgorithm':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _root_search(state: GameState, seed: int, options: Dict[str, Any]) -> Dict[Tuple, int]:
+    """Run one independent search in a worker process; return root visit counts."""
+    random.seed(seed)
+    state.seed_rng(seed)
+    algorithm = MCTSAlgorithm(reuse_tree=False, **options)
+    root = algorithm._new_root(state)
+    root.best_action(simulations_number=algorithm.simulations_per_move,
+                     rollouts_per_leaf=algorithm.rollouts_per_leaf,
+                     leaf_batch=algorithm.leaf_batch,
+                     threads=algorithm.threads)
+    return {root.action_to(child): child.n() for child in root.children}
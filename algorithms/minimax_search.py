@@ -1,10 +1,52 @@
 import math
 import sys
-from typing import Tuple, Optional, Dict
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from games.game_state import GameState
 from .search_algorithm import SearchAlgorithm
 
+# Transposition table bound flags: how a stored value relates to the true score.
+EXACT, LOWER, UPPER = 0, 1, 2
+
+class TTEntry(NamedTuple):
+    """Transposition table entry; *value* is from the side to move."""
+    value: float
+    depth: float # remaining search depth the value was computed with
+    flag: int    # EXACT, LOWER (value is a lower bound) or UPPER
+    best: Optional[Tuple] # best (or refuting) action found, if any
+
+class _SearchTimeout(Exception):
+    """Raised inside a search iteration once the time limit has passed."""
+
+class _BoundedTable:
+    """Fixed-size transposition table with depth-preferred replacement.
+
+    One entry per slot, chosen by the state's hash. A new entry replaces the
+    stored one unless that one was searched deeper.
+    """
+    __slots__ = ("_mask", "_keys", "_entries")
+
+    def __init__(self, size_bits: int) -> None:
+        size = 1 << size_bits
+        self._mask = size - 1
+        self._keys: List[Optional[GameState]] = [None] * size
+        self._entries: List[Optional[TTEntry]] = [None] * size
+
+    def get(self, state: GameState) -> Optional[TTEntry]:
+        slot = hash(state) & self._mask
+        key = self._keys[slot]
+        if key is not None and key == state:
+            return self._entries[slot]
+        return None
+
+    def __setitem__(self, state: GameState, entry: TTEntry) -> None:
+        slot = hash(state) & self._mask
+        old = self._entries[slot]
+        if old is None or entry.depth >= old.depth or self._keys[slot] == state:
+            self._keys[slot] = state
+            self._entries[slot] = entry
+
 class MinimaxSearch(SearchAlgorithm): # Renamed class
     """Minimax search algorithm with Alpha-Beta Pruning.
 
@@ -13,17 +55,53 @@ class MinimaxSearch(SearchAlgorithm): # Renamed class
     while pruning branches that cannot influence the final decision.
     """
 
-    def __init__(self, max_depth: Optional[int] = None, **kwargs) -> None:
-        """Initialize MinimaxSearch with an optional maximum search depth."""
+    def __init__(self, max_depth: Optional[int] = None, tt_size_bits: Optional[int] = None,
+                 iterative_deepening: bool = False, time_limit: Optional[float] = None,
+                 null_move_reduction: Optional[int] = None, **kwargs) -> None:
+        """Initialize MinimaxSearch with an optional maximum search depth.
+
+        *tt_size_bits* bounds the transposition table to 2**bits entries;
+        by default it grows without limit for the duration of a search.
+        With *iterative_deepening* the search goes 1, 2, ... plies deep,
+        each pass ordering moves by the table's results from the last. A
+        *time_limit* in seconds implies it: the search returns the best move
+        of the deepest pass completed in time.
+
+        *null_move_reduction* (R, typically 2) enables null-move pruning for
+        games that implement `skip_move`: if passing, searched R plies
+        shallower, still fails high, the node is cut off. It speeds up
+        depth-limited searches but can miss moves a pass would not refute
+        (zugzwang), so it is off by default and only applies under a finite
+        depth limit.
+
+        Games with a compiled search (`GameState.fast_negamax`) use it only
+        for passes that go straight to max_depth with no time limit and no
+        null moves; other passes run in Python.
+        """
         super().__init__(**kwargs)
         self.max_depth = max_depth if max_depth is not None else float('inf')
         if self.max_depth <= 0:
             raise ValueError("Max depth must be positive or None.")
-        # Simple caching for minimax results (transposition table)
-        # Note: Alpha-beta requires storing bounds, not just exact values for cache hits
-        # For simplicity, this cache stores exact scores, which might limit pruning effectiveness
-        # if a cached state is encountered with looser bounds.
-        self._cache: Dict[GameState, float] = {}
+        if tt_size_bits is not None and tt_size_bits <= 0:
+            raise ValueError("Transposition table size bits must be positive or None.")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Time limit must be positive or None.")
+        self.tt_size_bits = tt_size_bits
+        self.iterative_deepening = iterative_deepening or time_limit is not None
+        self.time_limit = time_limit
+        if null_move_reduction is not None and null_move_reduction < 0:
+            raise ValueError("Null move reduction must be non-negative or None.")
+        self.null_move_reduction = null_move_reduction
+        # Transposition table: each entry records the value, the depth it was
+        # searched to and whether it is exact or only a bound from a cutoff,
+        # so that hits stay correct under any alpha-beta window.
+        self._cache: Union[Dict[GameState, TTEntry], _BoundedTable] = {}
+        self._order_moves = False
+        self._null_moves = False
+        # Per-iteration state for iterative deepening
+        self._limit: float = self.max_depth
+        self._limited = False # some value in this iteration was cut off by _limit
+        self._deadline: Optional[float] = None
 
     def next_action(self, state: GameState) -> Tuple:
         """Find the next action using minimax search with alpha-beta pruning."""
@@ -33,9 +111,44 @@ class MinimaxSearch(SearchAlgorithm): # Renamed class
         available_actions = state.available_actions()
         if not available_actions:
             raise RuntimeError("No available actions from the current state.")
+        if len(available_actions) == 1:
+            return available_actions[0] # forced move: nothing to search
 
         # Clear cache for each new top-level search
-        self._cache = {}
+        self._cache = {} if self.tt_size_bits is None else _BoundedTable(self.tt_size_bits)
+        # Only sort moves if the game supplies a heuristic.
+        self._order_moves = type(state).move_order_key is not GameState.move_order_key
+        self._null_moves = (self.null_move_reduction is not None and self.max_depth != math.inf
+                            and type(state).skip_move is not GameState.skip_move)
+        available_actions = self._ordered(state, available_actions, None)
+
+        # Iterative deepening: search 1, 2, ... plies deep, keeping the
+        # transposition table so each pass starts from the previous pass's
+        # best moves. Stop at max_depth, or once a pass was not cut off by
+        # its depth limit anywhere (deeper passes would find the same).
+        # Without it, a single pass searches to max_depth.
+        deadline = None if self.time_limit is None else time.monotonic() + self.time_limit
+        best_action = None
+        limit = 1 if self.iterative_deepening else self.max_depth
+        while True:
+            self._limit = min(limit, self.max_depth)
+            self._limited = False
+            self._deadline = deadline if best_action is not None else None # always finish one pass
+            try:
+                best_action = self._search_root(state, available_actions)
+            except _SearchTimeout:
+                break
+            if not self._limited or self._limit >= self.max_depth:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            limit += 1
+            available_actions = [best_action] + [action for action in available_actions if action != best_action]
+        self._limit, self._deadline = self.max_depth, None
+        return best_action
+
+    def _search_root(self, state: GameState, available_actions: Sequence[Tuple]) -> Tuple:
+        """Search every root action to the current depth limit; return the best."""
         best_action = None
         # Initialize alpha and beta
         alpha = -math.inf
@@ -46,7 +159,7 @@ class MinimaxSearch(SearchAlgorithm): # Renamed class
 
         # Evaluate each possible action
         for action in available_actions:
-            next_state = state.move(action)
+            next_state = state.move_unchecked(action)
             # Pass alpha and beta to the recursive call
             score = self._minimax(next_state, 0, alpha, beta)
 
@@ -74,8 +187,16 @@ class MinimaxSearch(SearchAlgorithm): # Renamed class
 
         return best_action
 
+    def _ordered(self, state: GameState, actions: Sequence[Tuple], tt_best: Optional[Tuple]) -> Sequence[Tuple]:
+        """Order *actions* for search: the table's best move, then by heuristic."""
+        if self._order_moves:
+            actions = sorted(actions, key=state.move_order_key, reverse=True)
+        if tt_best is not None and actions[0] != tt_best:
+            actions = [tt_best] + [action for action in actions if action != tt_best]
+        return actions
+
     def _minimax(self, state: GameState, depth: int, alpha: float, beta: float) -> float:
-        """Recursive minimax helper function with alpha-beta pruning, caching, and depth limit.
+        """Minimax value of *state* with alpha-beta pruning, caching, and depth limit.
 
         Args:
             state: The current game state.
@@ -86,47 +207,121 @@ class MinimaxSearch(SearchAlgorithm): # Renamed class
         Returns:
             The score of the state from the perspective of Player 1 (X).
         """
-        # Check cache first (Basic caching - see note in __init__)
-        if state in self._cache:
-            # Potential issue: cached value might be from different alpha/beta bounds.
-            # A full transposition table would store bounds (upper, lower, exact).
-            # For simplicity, we return the cached value directly.
-            return self._cache[state]
-
-        # Check for terminal state or depth limit
-        if state.is_game_over() or depth >= self.max_depth:
-            result = float(state.game_result())
-            self._cache[state] = result # Cache terminal/depth-limited result
-            return result
+        # Negamax scores from the side to move: flip the window for player -1.
+        color = state.current_player
+        if color == 1:
+            lo, hi = alpha, beta
+        else:
+            lo, hi = -beta, -alpha
+        # Games with a compiled search skip the Python one entirely, but only
+        # on a plain pass to max_depth: the compiled search neither reports
+        # depth cutoffs to iterative deepening nor checks the deadline, and it
+        # does not prune with null moves.
+        value = None
+        if self._limit == self.max_depth and self._deadline is None and not self._null_moves:
+            value = state.fast_negamax(lo, hi, self._limit - depth)
+        if value is None:
+            value = self._negamax(state, depth, lo, hi)
+        return color * value
 
-        available_actions = state.available_actions()
-        if not available_actions:
-            # No legal moves from non-terminal state? Treat as draw.
-            self._cache[state] = 0.0
-            return 0.0
-
-        # Recursive step with alpha-beta pruning
-        if state.current_player == 1: # Maximizing player (X)
-            max_score = -math.inf
-            for action in available_actions:
-                score = self._minimax(state.move(action), depth + 1, alpha, beta)
-                max_score = max(max_score, score)
-                alpha = max(alpha, max_score) # Update alpha *before* the check
-                # The prune condition compares the best score the maximizer can guarantee (alpha)
-                # against the best score the minimizer can guarantee (beta).
-                if alpha >= beta: # Pruning condition (Corrected)
-                    break # Beta cutoff
-            self._cache[state] = max_score # Cache result
-            return max_score
-        else: # Minimizing player (O)
-            min_score = math.inf
-            for action in available_actions:
-                score = self._minimax(state.move(action), depth + 1, alpha, beta)
-                min_score = min(min_score, score)
-                beta = min(beta, min_score) # Update beta *before* the check
-                # The prune condition compares the best score the minimizer can guarantee (beta)
-                # against the best score the maximizer can guarantee (alpha).
-                if beta <= alpha: # Pruning condition (Corrected)
-                    break # Alpha cutoff
-            self._cache[state] = min_score # Cache result
-            return min_score
\ No newline at end of file
+    def _negamax(self, root: GameState, depth: int, alpha: float, beta: float, allow_null: bool = True) -> float:
+        """Iterative negamax with alpha-beta pruning and a transposition table.
+
+        Returns the score of *root* from the perspective of its player to
+        move. An explicit stack of frames replaces recursion; each frame is
+        `[state, actions, next action index, alpha, beta, best score, depth,
+        original alpha, best action, depth-limited]`. A value is
+        depth-limited if the depth limit cut off some line under it; values
+        that are not are stored with infinite depth, valid for any search.
+        *allow_null* is False for the null-move search itself, so that two
+        passes never follow each other.
+        """
+        cache = self._cache
+        max_depth = self._limit
+        deadline = self._deadline
+        null_reduction = self.null_move_reduction if self._null_moves else None
+        nodes = 0
+        stack: List[List[Any]] = []
+        state = root
+        while True:
+            # Evaluate `state`: either a leaf value or a new frame to search.
+            remaining = max_depth - depth
+            entry = cache.get(state)
+            value: Optional[float] = None
+            limited = False
+            if entry is not None and entry.depth >= remaining:
+                limited = entry.depth != math.inf
+                if entry.flag == EXACT:
+                    value = entry.value
+                elif entry.flag == LOWER:
+                    if entry.value > alpha:
+                        alpha = entry.value
+                elif entry.value < beta:
+                    beta = entry.value
+                if value is None and alpha >= beta:
+                    value = entry.value # the bound alone causes a cutoff
+            if value is None:
+                status = state.game_status()
+                if status is not None:
+                    value = state.current_player * float(status)
+                    cache[state] = TTEntry(value, math.inf, EXACT, None) # exact at any depth
+                elif remaining <= 0:
+                    value = state.current_player * float(state.game_result())
+                    limited = True
+                    cache[state] = TTEntry(value, 0, EXACT, None)
+                else:
+                    actions = state.available_actions()
+                    if not actions:
+                        # No legal moves from non-terminal state? Treat as draw.
+                        value = 0.0
+                        cache[state] = TTEntry(value, math.inf, EXACT, None)
+                    elif (null_reduction is not None and remaining > null_reduction + 1 and beta < math.inf
+                          and len(actions) > 4 and (allow_null or state is not root)
+                          and -self._negamax(state.skip_move(), depth + 1 + null_reduction,
+                                             -beta, -beta + 1, False) >= beta):
+                        # Even passing fails high: assume a real move would too.
+                        value = beta
+                        limited = True
+                    else:
+                        nodes += 1
+                        if deadline is not None and not nodes & 1023 and time.monotonic() >= deadline:
+                            raise _SearchTimeout()
+                        actions = self._ordered(state, actions, entry.best if entry is not None else None)
+                        stack.append([state, actions, 0, alpha, beta, -math.inf, depth, alpha, None, limited])
+                        state = state.move_unchecked(actions[0])
+                        depth += 1
+                        alpha, beta = -beta, -alpha
+                        continue
+
+            # Hand the value up until some frame has another child to search.
+            while stack:
+                frame = stack[-1]
+                score = -value
+                if limited:
+                    frame[9] = True
+                if score > frame[5]:
+                    frame[5] = score
+                    frame[8] = frame[1][frame[2]]
+                    if score > frame[3]:
+                        frame[3] = score
+                frame[2] += 1
+                if frame[3] >= frame[4] or frame[2] == len(frame[1]): # cutoff or done
+                    stack.pop()
+                    value = frame[5]
+                    limited = frame[9]
+                    if value <= frame[7]:
+                        flag = UPPER # every move failed low
+                    elif value >= frame[4]:
+                        flag = LOWER # cutoff: the true score may be higher
+                    else:
+                        flag = EXACT
+                    cache[frame[0]] = TTEntry(value, max_depth - frame[6] if limited else math.inf, flag, frame[8])
+                    continue
+                state = frame[0].move_unchecked(frame[1][frame[2]])
+                depth = frame[6] + 1
+                alpha, beta = -frame[4], -frame[3]
+                break
+            else:
+                if limited:
+                    self._limited = True
+                return value
@@ -0,0 +1,96 @@
+"""Numba-compiled random playout for Sudo Tic-Tac-Toe.
+
+Numba is optional: when it is not installed `NUMBA_AVAILABLE` is False and
+`rollout_from`, `rollout_batch` and `seed` are None, and callers fall back to the pure-Python
+rollout.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError: # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+
+def _rollout_from(x, o, status, forced, player, win_table):
+    """Play uniformly random moves to the end of the game; return the result.
+
+    Args:
+        x, o: int64[9] occupancy masks of each local board (modified).
+        status: int8[9] local board status, 0/1/-1/2 (modified).
+        forced: index of the board to play in, or -1 for any.
+        player: side to move, 1 or -1.
+        win_table: uint8[512], nonzero for masks that contain a line.
+
+    The position must not already be over.
+    """
+    cells = np.empty(81, dtype=np.int64)
+    while True:
+        n = 0
+        for b in range(9):
+            if status[b] != 0 or (forced >= 0 and b != forced):
+                continue
+            occupied = x[b] | o[b]
+            for c in range(9):
+                if not (occupied >> c) & 1:
+                    cells[n] = b * 9 + c
+                    n += 1
+        if n == 0:
+            return 0
+        pick = cells[np.random.randint(n)]
+        b = pick // 9
+        c = pick % 9
+        if player == 1:
+            x[b] |= 1 << c
+            mine = x[b]
+        else:
+            o[b] |= 1 << c
+            mine = o[b]
+        if win_table[mine]:
+            status[b] = player
+            # Only the mover can complete a meta line, by winning a board.
+            meta = 0
+            for k in range(9):
+                if status[k] == player:
+                    meta |= 1 << k
+            if win_table[meta]:
+                return player
+        elif (x[b] | o[b]) == 0x1FF:
+            status[b] = 2
+        decided = True
+        for k in range(9):
+            if status[k] == 0:
+                decided = False
+                break
+        if decided:
+            return 0
+        forced = c if status[c] == 0 else -1
+        player = -player
+
+
+def _rollout_batch(x, o, status, forced, player, win_table):
+    """Play one random game per row of the (N, 9) arrays; return int8[N].
+
+    Rows are independent, so they are spread over threads with `prange`.
+    The input arrays are modified.
+    """
+    n = x.shape[0]
+    results = np.empty(n, dtype=np.int8)
+    for i in prange(n):
+        results[i] = _rollout_from_jit(x[i], o[i], status[i], forced[i], player[i], win_table)
+    return results
+
+
+def _seed(seed):
+    """Seed the generator used by compiled code (separate from NumPy's)."""
+    np.random.seed(seed)
+
+
+if NUMBA_AVAILABLE:
+    _rollout_from_jit = njit(cache=True, nogil=True)(_rollout_from)
+    rollout_from = _rollout_from_jit
+    rollout_batch = njit(cache=True, nogil=True, parallel=True)(_rollout_batch)
+    seed = njit(cache=True)(_seed)
+else:
+    rollout_from = rollout_batch = seed = None
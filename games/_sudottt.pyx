@@ -0,0 +1,128 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional C extension with Sudo Tic-Tac-Toe hot-path helpers.
+
+Build in place (needs Cython and a C++ compiler):
+
+    cythonize -i -3 --cplus games/_sudottt.pyx
+
+When the compiled module is absent the pure-Python code paths are used.
+"""
+from libc.stdint cimport int8_t, uint16_t, uint64_t
+
+cdef uint16_t LOCAL_MASK = 0x1FF
+cdef unsigned char WIN_TABLE[512]
+
+cdef int _init_win_table():
+    cdef int mask, line
+    cdef int lines[8]
+    lines[:] = [0x007, 0x038, 0x1C0, 0x049, 0x092, 0x124, 0x111, 0x054]
+    for mask in range(512):
+        WIN_TABLE[mask] = 0
+        for line in range(8):
+            if mask & lines[line] == lines[line]:
+                WIN_TABLE[mask] = 1
+                break
+    return 0
+
+_init_win_table()
+
+
+cdef inline int _is_local_win(uint16_t mask) nogil:
+    return WIN_TABLE[mask & LOCAL_MASK]
+
+
+cdef inline int _legal_cells(uint16_t x, uint16_t o, uint16_t *out) nogil:
+    """Write the free cell indices of one local board to *out*; return the count."""
+    cdef uint16_t free = ~(x | o) & LOCAL_MASK
+    cdef int n = 0, c
+    for c in range(9):
+        if (free >> c) & 1:
+            out[n] = c
+            n += 1
+    return n
+
+
+cdef inline uint64_t _xorshift(uint64_t *s) nogil:
+    s[0] ^= s[0] >> 12
+    s[0] ^= s[0] << 25
+    s[0] ^= s[0] >> 27
+    return s[0] * 0x2545F4914F6CDD1DULL
+
+
+def is_local_win(int mask):
+    """True if the 9-bit occupancy *mask* contains a line."""
+    return _is_local_win(<uint16_t>mask) != 0
+
+
+def legal_cells(int x, int o):
+    """Free cells of a local board given both players' 9-bit masks."""
+    cdef uint16_t out[9]
+    cdef int n = _legal_cells(<uint16_t>x, <uint16_t>o, out)
+    return [out[i] for i in range(n)]
+
+
+cdef int _playout(uint16_t *x, uint16_t *o, int8_t *st, int forced, int player,
+                  uint64_t *rng) nogil:
+    cdef uint16_t cells[81]
+    cdef uint16_t local[9]
+    cdef int b, c, k, n, m, meta, pick
+    cdef uint16_t mine
+    while True:
+        n = 0
+        for b in range(9):
+            if st[b] != 0 or (forced >= 0 and b != forced):
+                continue
+            m = _legal_cells(x[b], o[b], local)
+            for k in range(m):
+                cells[n] = b * 9 + local[k]
+                n += 1
+        if n == 0:
+            return 0
+        pick = cells[_xorshift(rng) % n]
+        b = pick // 9
+        c = pick % 9
+        if player == 1:
+            x[b] |= 1 << c
+            mine = x[b]
+        else:
+            o[b] |= 1 << c
+            mine = o[b]
+        if _is_local_win(mine):
+            st[b] = player
+            # Only the mover can complete a meta line, by winning a board.
+            meta = 0
+            for k in range(9):
+                if st[k] == player:
+                    meta |= 1 << k
+            if _is_local_win(meta):
+                return player
+        elif (x[b] | o[b]) == LOCAL_MASK:
+            st[b] = 2
+        for k in range(9):
+            if st[k] == 0:
+                break
+        else:
+            return 0
+        forced = c if st[c] == 0 else -1
+        player = -player
+
+
+def rollout_from(x_bb, o_bb, status, int forced, int player, uint64_t seed):
+    """Play uniformly random moves to the end of the game; return the result.
+
+    Takes the packed 81-bit bitboards, the local board status list, the
+    forced board (-1 for any) and the side to move. The position must not
+    already be over. *seed* drives a xorshift generator.
+    """
+    cdef uint16_t x[9]
+    cdef uint16_t o[9]
+    cdef int8_t st[9]
+    cdef uint64_t rng = seed | 1 # xorshift state must be nonzero
+    cdef int b, result
+    for b in range(9):
+        x[b] = (x_bb >> (9 * b)) & 0x1FF
+        o[b] = (o_bb >> (9 * b)) & 0x1FF
+        st[b] = status[b]
+    with nogil:
+        result = _playout(x, o, st, forced, player, &rng)
+    return result
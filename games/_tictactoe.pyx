@@ -0,0 +1,107 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional C extension: negamax and random playouts for Tic-Tac-Toe on 9-bit boards.
+
+Build in place (needs Cython and a C++ compiler):
+
+    cythonize -i -3 --cplus games/_tictactoe.pyx
+
+When the compiled module is absent the pure-Python code paths are used.
+"""
+from libc.stdint cimport uint16_t, uint64_t
+
+cdef uint16_t FULL = 0x1FF
+cdef uint16_t WIN_MASKS[8]
+WIN_MASKS[:] = [0x007, 0x038, 0x1C0, 0x049, 0x092, 0x124, 0x111, 0x054]
+# Center, corners, then edges: same preference as TicTacToeState.move_order_key.
+cdef int ORDER[9]
+ORDER[:] = [4, 0, 2, 6, 8, 1, 3, 5, 7]
+
+
+cdef inline bint _has_line(uint16_t mask) nogil:
+    cdef int i
+    for i in range(8):
+        if mask & WIN_MASKS[i] == WIN_MASKS[i]:
+            return True
+    return False
+
+
+cdef int _negamax(uint16_t me, uint16_t opp, int alpha, int beta, int depth) nogil:
+    """Score (-1, 0 or 1) for the side to move, who owns *me*."""
+    cdef int i, cell, score, best
+    if _has_line(opp): # the previous move won
+        return -1
+    if (me | opp) == FULL or depth <= 0:
+        return 0
+    best = -2
+    for i in range(9):
+        cell = ORDER[i]
+        if (me | opp) & (1 << cell):
+            continue
+        score = -_negamax(opp, me | (1 << cell), -beta, -alpha, depth - 1)
+        if score > best:
+            best = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+    return best
+
+
+cdef inline uint64_t _xorshift(uint64_t *s) nogil:
+    s[0] ^= s[0] >> 12
+    s[0] ^= s[0] << 25
+    s[0] ^= s[0] >> 27
+    return s[0] * 0x2545F4914F6CDD1DULL
+
+
+cdef int _playout(uint16_t me, uint16_t opp, uint64_t *rng) nogil:
+    """Play random moves; return 1 if the side to move (*me*) wins, -1, or 0."""
+    cdef int cells[9]
+    cdef int n, c, sign = 1
+    cdef uint16_t free, swap
+    while True:
+        free = ~(me | opp) & FULL
+        n = 0
+        for c in range(9):
+            if (free >> c) & 1:
+                cells[n] = c
+                n += 1
+        if n == 0:
+            return 0
+        me |= 1 << cells[_xorshift(rng) % n]
+        if _has_line(me):
+            return sign
+        swap = me
+        me = opp
+        opp = swap
+        sign = -sign
+
+
+def negamax(int me, int opp, int alpha, int beta, int depth):
+    """Alpha-beta negamax value of a position for the side to move.
+
+    *me* and *opp* are the 9-bit occupancy masks of the side to move and of
+    its opponent; cell i is bit i. Scores are -1, 0 or 1 and the search
+    stops *depth* plies down, scoring unfinished positions as draws.
+    """
+    cdef int result
+    with nogil:
+        result = _negamax(<uint16_t>me, <uint16_t>opp, alpha, beta, depth)
+    return result
+
+
+def rollout_from(int x, int o, int player, uint64_t seed):
+    """Play uniformly random moves to the end of the game; return the result.
+
+    Takes the 9-bit masks of X and O and the side to move; the result is from
+    X's perspective. The position must not already be over. *seed* drives a
+    xorshift generator.
+    """
+    cdef uint64_t rng = seed | 1 # xorshift state must be nonzero
+    cdef int result
+    with nogil:
+        if player == 1:
+            result = _playout(<uint16_t>x, <uint16_t>o, &rng)
+        else:
+            result = -_playout(<uint16_t>o, <uint16_t>x, &rng)
+    return result
@@ -1,5 +1,6 @@
+import random
 from abc import ABC, abstractmethod
-from typing import List, Any, Optional, Tuple
+from typing import List, Any, Hashable, Optional, Sequence, Tuple
 
 class GameState(ABC):
     """Abstract Base Class for a game state usable with MCTS.
@@ -13,6 +14,8 @@ class GameState(ABC):
     # Subclasses MUST override this.
     game_title: str = "Abstract Game (Please Override)"
     simulations_per_move: int = 200 # Default MCTS simulations per move
+    # Set to True by games that implement clone/apply_inplace/undo below
+    supports_inplace_moves: bool = False
 
     @property
     @abstractmethod
@@ -21,8 +24,12 @@ class GameState(ABC):
         pass
 
     @abstractmethod
-    def available_actions(self) -> List[Tuple]:
-        """Return a list of all valid actions for the current player."""
+    def available_actions(self) -> Sequence[Tuple]:
+        """Return all valid actions for the current player.
+
+        Implementations may cache and return the same sequence on every call,
+        so callers must not mutate the result.
+        """
         pass
 
     @abstractmethod
@@ -31,9 +38,24 @@ class GameState(ABC):
 
         This method should return a *new* game state instance
         and not modify the current state in place.
+
+        Search plays its moves through `move_unchecked` (or, for scratch
+        copies, `apply_inplace`), which usually shares the successor-building
+        code with this method, so that copy should be cheap: both games keep
+        each player's cells as integer bitboards. Small NumPy arrays are
+        compact, but copying and indexing them costs several times more than
+        a few ints or a short list.
         """
         pass
 
+    def move_unchecked(self, action: Tuple) -> 'GameState':
+        """Like `move`, for an action known to be legal.
+
+        Search algorithms only play actions taken from `available_actions`,
+        so games can skip validating them here. The default calls `move`.
+        """
+        return self.move(action)
+
     @abstractmethod
     def is_game_over(self) -> bool:
         """Return True if the game has ended, False otherwise."""
@@ -66,6 +88,120 @@ class GameState(ABC):
         """Check if this state is equal to another state."""
         pass
 
+    # --- Optional methods for faster simulation ---
+
+    def clone(self) -> 'GameState':
+        """Return a copy of this state that may be modified in place."""
+        raise NotImplementedError("In-place moves not implemented for this game state.")
+
+    def apply_inplace(self, action: Tuple) -> Any:
+        """Apply a legal action to this state in place and return an undo token.
+
+        Only called on copies returned by `clone`, and only when
+        `supports_inplace_moves` is True.
+        """
+        raise NotImplementedError("In-place moves not implemented for this game state.")
+
+    def undo(self, token: Any) -> None:
+        """Revert the `apply_inplace` call that returned *token*."""
+        raise NotImplementedError("In-place moves not implemented for this game state.")
+
+    def release(self) -> None:
+        """Signal that this state will not be used again.
+
+        Games may recycle released instances to reduce allocations; the
+        default does nothing.
+        """
+        pass
+
+    def move_order_key(self, action: Tuple) -> int:
+        """Heuristic priority of *action*; higher values are searched first.
+
+        Alpha-beta prunes far more when good moves come first. The default
+        gives every move the same priority, keeping the game's order.
+        """
+        return 0
+
+    def book_move(self) -> Optional[Tuple]:
+        """Return a precomputed move for this position, or None.
+
+        Games can answer well-known positions (such as the opening) from a
+        small book, letting MCTS skip a search whose result is known. The
+        default has no book.
+        """
+        return None
+
+    def skip_move(self) -> 'GameState':
+        """Return this position with the other player to move (a "pass").
+
+        Used by null-move pruning in MinimaxSearch; games opt in by
+        overriding it.
+        """
+        raise NotImplementedError("Null moves not implemented for this game state.")
+
+    def canonical_key(self) -> Hashable:
+        """Return a key shared by all positions equivalent to this one.
+
+        Games with board symmetries can map symmetric positions to the same
+        key so that searches treat them as one. The default is the state
+        itself (exact matches only).
+        """
+        return self
+
+    @classmethod
+    def seed_rng(cls, seed: int) -> None:
+        """Seed random generators the game uses besides the `random` module.
+
+        Called in worker processes so that parallel searches differ.
+        """
+        pass
+
+    def game_status(self) -> Optional[int]:
+        """Return None while the game is in progress, else `game_result()`.
+
+        Search loops need both answers for every state they visit; games can
+        override this to work them out in one pass over the board.
+        """
+        return self.game_result() if self.is_game_over() else None
+
+    def fast_rollout(self) -> Optional[int]:
+        """Play a uniformly random game from this state in native code.
+
+        Returns the result (Player 1's perspective), or None if the game has
+        no native rollout, in which case the search plays it in Python.
+        """
+        return None
+
+    def fast_negamax(self, alpha: float, beta: float, depth: float) -> Optional[float]:
+        """Alpha-beta negamax value of this state, searched in native code.
+
+        The value is from the side to move's perspective and the search stops
+        *depth* plies down (it may be infinite). Returns None if the game has
+        no native search, in which case MinimaxSearch searches in Python.
+        """
+        return None
+
+    @classmethod
+    def rollout_batch(cls, states: Sequence['GameState']) -> Sequence[int]:
+        """Play a uniformly random game from each state; return the results.
+
+        Results are from Player 1's perspective, as with `game_result`.
+        Games can override this with a vectorized implementation; the
+        default plays the games one at a time.
+        """
+        results: List[int] = []
+        for state in states:
+            status = state.game_status()
+            while status is None:
+                actions = state.available_actions()
+                if not actions:
+                    status = 0
+                    break
+                state = state.move_unchecked(random.choice(actions))
+                status = state.game_status()
+            results.append(status)
+        return results
+
     # --- Optional methods for enhanced CLI ---
 
     def get_action_prompt(self) -> str:
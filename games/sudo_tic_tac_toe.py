@@ -13,7 +13,14 @@ forming a **meta** board:
     6 | 7 | 8              <- indices of local boards
 
 *Players*: **X** is encoded as `1`, **O** as `-1`.
-*Empty cells* are `0`.
+
+Board representation
+~~~~~~~~~~~~~~~~~~~~
+The 81 cells are stored as two packed *bitboards* (plain Python ints), one per
+player: bit `9 * board + cell` of `x_bb` (resp. `o_bb`) is set when that cell
+holds an X (resp. an O).  A local board is extracted with
+`(bb >> (9 * board)) & 0x1FF`, so applying a move is a single OR and no board
+copying is ever required.
 
 Turn order
 ~~~~~~~~~~
@@ -49,12 +56,27 @@ with the `GameState` API expected by the MCTS engine.
 
 from __future__ import annotations
 
-import copy
-from typing import List, Optional, Sequence, Tuple, Any
+import random
+from typing import List, Optional, Sequence, Tuple, Any, cast
+
+import numpy as np
 
 from .game_state import GameState
+from ._rollout_numba import (
+    rollout_batch as _numba_rollout_batch,
+    rollout_from as _numba_rollout_from,
+    seed as _numba_seed,
+)
+
+try: # optional C extension, see _sudottt.pyx for the build command
+    from . import _sudottt
+except ImportError:
+    _sudottt = None
 
 SudoAction = Tuple[int, int]
+# (board_idx, cell_idx, previous board_status, previous forced_board, previous hash,
+#  previous decided-board bitmask, previous winner)
+SudoUndo = Tuple[int, int, List[int], Optional[int], int, int, int]
 
 _WIN_LINES: Tuple[Tuple[int, int, int], ...] = (
     (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
@@ -62,10 +84,133 @@ _WIN_LINES: Tuple[Tuple[int, int, int], ...] = (
     (0, 4, 8), (2, 4, 6),             # diagonals
 )
 
+# 9-bit masks of the winning lines, in the bit layout of a local board.
+_WIN_MASKS: Tuple[int, ...] = tuple(sum(1 << i for i in line) for line in _WIN_LINES)
+
+_LOCAL_MASK = 0x1FF  # all nine cells of one local board
+
+# `_BOARD_ACTIONS[b][free]` lists the actions `(b, c)` for every bit `c` set in
+# the 9-bit mask *free* of empty cells of local board `b`.  The action tuples
+# are shared, so generating legal moves allocates nothing per cell.
+_ACTIONS: Tuple[SudoAction, ...] = tuple((b, c) for b in range(9) for c in range(9))
+_BOARD_ACTIONS: Tuple[Tuple[Tuple[SudoAction, ...], ...], ...] = tuple(
+    tuple(
+        tuple(_ACTIONS[9 * b + c] for c in range(9) if (free >> c) & 1)
+        for free in range(512)
+    )
+    for b in range(9)
+)
 
-def _is_local_win(board: Sequence[int], player: int) -> bool:
-    """Return `True` iff *player* has a winning line on *board*."""
-    return any(all(board[i] == player for i in line) for line in _WIN_LINES)
+# `_OPEN_BOARDS[decided]` lists the board indices whose bit is clear in the
+# 9-bit mask *decided*, i.e. the boards a free move may go to.
+_OPEN_BOARDS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(b for b in range(9) if not (decided >> b) & 1) for decided in range(512)
+)
+
+# `_WIN_TABLE[mask]` is 1 iff the 9-bit occupancy *mask* of one player
+# contains a winning line, turning the local win test into a single index.
+_WIN_TABLE: bytes = bytes(
+    1 if any((mask & m) == m for m in _WIN_MASKS) else 0 for mask in range(512)
+)
+
+# Number of winning lines through each cell of a 3x3 grid.
+_CELL_LINES: Tuple[int, ...] = tuple(sum(i in line for line in _WIN_LINES) for i in range(9))
+
+
+def _str_layout() -> Tuple[bytes, Tuple[int, ...]]:
+    """Return the text of an empty board and the offset of each cell in it.
+
+    Empty cells show their index; `__str__` only overwrites occupied ones.
+    """
+    separator = "-------+-------+-------"
+    header = " B {} | B {} | B {} "
+    text = ""
+    offsets = [0] * 81
+    for big_row in range(3):
+        text += header.format(3 * big_row, 3 * big_row + 1, 3 * big_row + 2) + "\n"
+        for small_row in range(3):
+            for big_col in range(3):
+                if big_col:
+                    text += " | "
+                for i in range(3):
+                    if i:
+                        text += " "
+                    cell = 3 * small_row + i
+                    offsets[9 * (3 * big_row + big_col) + cell] = len(text)
+                    text += str(cell)
+            text += "\n"
+        if big_row < 2:
+            text += separator + "\n"
+    return text[:-1].encode("ascii"), tuple(offsets)
+
+
+_STR_TEMPLATE, _STR_OFFSETS = _str_layout()
+
+# Zobrist keys: a state's hash is the XOR of the keys of its X cells, O cells,
+# forced board (index 9 for a free move) and, if O is to move, _ZOBRIST_PLAYER.
+# A move then updates the hash with a few XORs instead of rehashing the board.
+_zobrist_rng = random.Random(0x5D0)  # fixed seed: hashes are stable across runs
+_ZOBRIST_X: Tuple[int, ...] = tuple(_zobrist_rng.getrandbits(64) for _ in range(81))
+_ZOBRIST_O: Tuple[int, ...] = tuple(_zobrist_rng.getrandbits(64) for _ in range(81))
+_ZOBRIST_FORCED: Tuple[int, ...] = tuple(_zobrist_rng.getrandbits(64) for _ in range(10))
+_ZOBRIST_PLAYER: int = _zobrist_rng.getrandbits(64)
+del _zobrist_rng
+
+
+def _zobrist(x_bb: int, o_bb: int, current_player: int, forced_board: Optional[int]) -> int:
+    """Compute the Zobrist hash of a position from scratch."""
+    h = _ZOBRIST_FORCED[9 if forced_board is None else forced_board]
+    if current_player == -1:
+        h ^= _ZOBRIST_PLAYER
+    for i in range(81):
+        if (x_bb >> i) & 1:
+            h ^= _ZOBRIST_X[i]
+        elif (o_bb >> i) & 1:
+            h ^= _ZOBRIST_O[i]
+    return h
+
+
+# The 8 symmetries of a 3x3 grid as permutations of its indices. Applying the
+# same permutation to the local boards and to the cells within each board maps
+# a position to an equivalent one (the forced board is permuted likewise).
+_SYMMETRIES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(3 * rr + cc for rr, cc in (f(i // 3, i % 3) for i in range(9)))
+    for f in (
+        lambda r, c: (r, c),
+        lambda r, c: (c, 2 - r),
+        lambda r, c: (2 - r, 2 - c),
+        lambda r, c: (2 - c, r),
+        lambda r, c: (r, 2 - c),
+        lambda r, c: (2 - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (2 - c, 2 - r),
+    )
+)
+# Zobrist keys of each symmetric image: `_SYM_ZOBRIST_X[i]` holds, per
+# symmetry, the key of the cell that bit i is mapped to.
+_SYM_ZOBRIST_X: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_ZOBRIST_X[9 * p[i // 9] + p[i % 9]] for p in _SYMMETRIES) for i in range(81)
+)
+_SYM_ZOBRIST_O: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_ZOBRIST_O[9 * p[i // 9] + p[i % 9]] for p in _SYMMETRIES) for i in range(81)
+)
+
+
+def _canonical_zobrist(x_bb: int, o_bb: int, current_player: int, forced_board: Optional[int]) -> int:
+    """Return the smallest Zobrist hash among the 8 symmetric images of a position."""
+    base = _ZOBRIST_PLAYER if current_player == -1 else 0
+    hashes = [
+        base ^ _ZOBRIST_FORCED[9 if forced_board is None else p[forced_board]]
+        for p in _SYMMETRIES
+    ]
+    for bb, keys in ((x_bb, _SYM_ZOBRIST_X), (o_bb, _SYM_ZOBRIST_O)):
+        while bb:
+            low = bb & -bb
+            sym_keys = keys[low.bit_length() - 1]
+            for k in range(8):
+                hashes[k] ^= sym_keys[k]
+            bb ^= low
+    return min(hashes)
 
 
 def _is_meta_win(board_status: Sequence[int], player: int) -> bool:
@@ -73,35 +218,64 @@ def _is_meta_win(board_status: Sequence[int], player: int) -> bool:
     return any(all(board_status[i] == player for i in line) for line in _WIN_LINES)
 
 
+# Released states recycled by `SudoTicTacToeState.clone` (and so by `move`).
+_STATE_POOL: List["SudoTicTacToeState"] = []
+_STATE_POOL_LIMIT = 1 << 16
+
+
 class SudoTicTacToeState(GameState):
-    """Concrete `GameState` for Sudo / Ultimate Tic-Tac-Toe."""
+    """Concrete `GameState` for Sudo / Ultimate Tic-Tac-Toe.
+
+    States are immutable: `move` returns a new instance, and successors may
+    share the parent's `board_status` list, which is therefore never mutated
+    in place.  The only exception is scratch copies made with `clone`, which
+    rollouts advance with `apply_inplace` to avoid allocating a state per ply.
+    """
 
-    __slots__ = ("boards", "board_status", "_current_player", "forced_board")
+    __slots__ = (
+        "x_bb", "o_bb", "board_status", "_current_player", "forced_board",
+        "_cached_legal", "_zhash", "_canonical", "_decided", "_winner",
+    )
 
     # --- class-level metadata ------------------------------------------- #
     game_title: str = "Sudo Tic-Tac-Toe"
     simulations_per_move: int = 400
+    supports_inplace_moves: bool = True
 
     # --- instance attributes ------------------------------------------- #
-    boards: List[List[int]]
+    x_bb: int  # bit 9*b+c set when X occupies cell c of local board b
+    o_bb: int  # same for O
     board_status: List[int]  # 0 undecided, 1 X won, -1 O won, 2 draw
     _current_player: int
     forced_board: Optional[int]
+    _cached_legal: Optional[Tuple[SudoAction, ...]]  # lazily computed legal moves
+    _zhash: int  # Zobrist hash, updated incrementally by `_play`
+    _canonical: Optional[int]  # lazily computed symmetry-canonical hash
+    _decided: int  # 9-bit mask of the local boards won or drawn
+    _winner: int  # meta-board winner (1 / -1), 0 while there is none
 
     # ------------------------------------------------------------------- #
     #                          Lifecycle                                  #
     # ------------------------------------------------------------------- #
     def __init__(
         self,
-        boards: Optional[List[List[int]]] = None,
+        x_bb: int = 0,
+        o_bb: int = 0,
         board_status: Optional[List[int]] = None,
         current_player: int = 1,
         forced_board: Optional[int] = None,
     ) -> None:
-        self.boards = boards if boards is not None else [[0] * 9 for _ in range(9)]
+        self.x_bb = x_bb
+        self.o_bb = o_bb
         self.board_status = board_status if board_status is not None else [0] * 9
         self._current_player = current_player
         self.forced_board = forced_board
+        self._cached_legal = None
+        self._zhash = _zobrist(x_bb, o_bb, current_player, forced_board)
+        self._canonical = None
+        status = self.board_status
+        self._decided = sum(1 << b for b, st in enumerate(status) if st != 0)
+        self._winner = 1 if _is_meta_win(status, 1) else -1 if _is_meta_win(status, -1) else 0
 
     # ------------------------------------------------------------------- #
     #                      GameState interface                            #
@@ -113,25 +287,29 @@ class SudoTicTacToeState(GameState):
         return self._current_player
 
     # --- legal actions -------------------------------------------------- #
-    def available_actions(self) -> List[SudoAction]:
-        """Return all legal moves for the current player."""
+    def available_actions(self) -> Tuple[SudoAction, ...]:
+        """Return all legal moves for the current player.
 
-        def _empty_cells(b_idx: int) -> List[SudoAction]:
-            return [
-                (b_idx, c_idx)
-                for c_idx, cell in enumerate(self.boards[b_idx])
-                if cell == 0
-            ]
+        The result is computed once per state and cached; callers must not
+        rely on getting a fresh object.
+        """
+        if self._cached_legal is None:
+            self._cached_legal = self._compute_legal()
+        return self._cached_legal
+
+    def _compute_legal(self) -> Tuple[SudoAction, ...]:
+        occupied = self.x_bb | self.o_bb
+        decided = self._decided
 
         # Forced-board rule applies if that board is not yet decided.
-        if self.forced_board is not None and self.board_status[self.forced_board] == 0:
-            return _empty_cells(self.forced_board)
+        b_idx = self.forced_board
+        if b_idx is not None and not (decided >> b_idx) & 1:
+            return _BOARD_ACTIONS[b_idx][~(occupied >> (9 * b_idx)) & _LOCAL_MASK]
 
         # Otherwise the player may move in any undecided local board.
-        legal: List[SudoAction] = []
-        for b_idx, status in enumerate(self.board_status):
-            if status == 0:
-                legal.extend(_empty_cells(b_idx))
+        legal: Tuple[SudoAction, ...] = ()
+        for b_idx in _OPEN_BOARDS[decided]:
+            legal += _BOARD_ACTIONS[b_idx][~(occupied >> (9 * b_idx)) & _LOCAL_MASK]
         return legal
 
     # --- state transition ---------------------------------------------- #
@@ -142,7 +320,9 @@ class SudoTicTacToeState(GameState):
         # Validate action ------------------------------------------------- #
         if not (0 <= board_idx <= 8 and 0 <= cell_idx <= 8):
             raise ValueError("Action coordinates out of bounds 0-8.")
-        if self.boards[board_idx][cell_idx] != 0:
+        shift = 9 * board_idx
+        bit = 1 << (shift + cell_idx)
+        if (self.x_bb | self.o_bb) & bit:
             raise ValueError("Illegal move: cell already occupied.")
         if self.board_status[board_idx] != 0:
             raise ValueError("Illegal move: local board already decided.")
@@ -155,98 +335,218 @@ class SudoTicTacToeState(GameState):
                 f"Illegal move: must play in forced board {self.forced_board}"
             )
 
-        # Apply move ------------------------------------------------------ #
-        new_boards = copy.deepcopy(self.boards)
-        new_status = self.board_status.copy()
+        return self.move_unchecked(action)
 
-        new_boards[board_idx][cell_idx] = self._current_player
+    def move_unchecked(self, action: SudoAction) -> "SudoTicTacToeState":
+        """Return the successor for a legal *action*, without validating it."""
+        successor = self.clone()
+        successor._play(action[0], action[1])
+        return successor
+
+    # --- in-place simulation ------------------------------------------- #
+    def clone(self) -> "SudoTicTacToeState":
+        """Return a copy of this state that may be modified in place."""
+        # Recycle a released instance if possible and fill its slots directly.
+        # A single pop() is atomic, so threaded rollouts can share the pool;
+        # testing for emptiness first would race with them.
+        try:
+            new = _STATE_POOL.pop()
+        except IndexError:
+            new = SudoTicTacToeState.__new__(SudoTicTacToeState)
+        new.x_bb = self.x_bb
+        new.o_bb = self.o_bb
+        # The status list is shared; `_play` copies it before writing.
+        new.board_status = self.board_status
+        new._current_player = self._current_player
+        new.forced_board = self.forced_board
+        new._cached_legal = self._cached_legal
+        new._zhash = self._zhash
+        new._canonical = self._canonical
+        new._decided = self._decided
+        new._winner = self._winner
+        return new
+
+    def release(self) -> None:
+        """Put this state on the free list used by `clone`."""
+        if len(_STATE_POOL) < _STATE_POOL_LIMIT:
+            _STATE_POOL.append(self)
+
+    def apply_inplace(self, action: SudoAction) -> SudoUndo:
+        """Play a *legal* action on this state and return an undo token.
+
+        No validation is done; only call this on scratch copies from `clone`.
+        """
+        board_idx, cell_idx = action
+        token = (board_idx, cell_idx, self.board_status, self.forced_board, self._zhash,
+                 self._decided, self._winner)
+        self._play(board_idx, cell_idx)
+        return token
+
+    def undo(self, token: SudoUndo) -> None:
+        """Revert the `apply_inplace` call that returned *token*."""
+        (board_idx, cell_idx, self.board_status, self.forced_board, self._zhash,
+         self._decided, self._winner) = token
+        self._current_player = -self._current_player
+        self._cached_legal = None
+        self._canonical = None
+        clear = ~(1 << (9 * board_idx + cell_idx))
+        if self._current_player == 1:
+            self.x_bb &= clear
+        else:
+            self.o_bb &= clear
+
+    def _play(self, board_idx: int, cell_idx: int) -> None:
+        """Place the current player's mark and advance the turn, in place."""
+        shift = 9 * board_idx
+        index = shift + cell_idx
+        bit = 1 << index
+        player = self._current_player
+        if player == 1:
+            self.x_bb |= bit
+            player_local = (self.x_bb >> shift) & _LOCAL_MASK
+            zhash = self._zhash ^ _ZOBRIST_X[index]
+        else:
+            self.o_bb |= bit
+            player_local = (self.o_bb >> shift) & _LOCAL_MASK
+            zhash = self._zhash ^ _ZOBRIST_O[index]
 
         # Update local board status -------------------------------------- #
-        # Only update if not already decided
-        if new_status[board_idx] == 0:
-            if _is_local_win(new_boards[board_idx], self._current_player):
-                new_status[board_idx] = self._current_player
-            elif 0 not in new_boards[board_idx]:
-                new_status[board_idx] = 2  # local draw
+        # The target board is undecided (callers guarantee legality).  Status
+        # lists may be shared between states, so copy before writing.
+        status = self.board_status
+        if _WIN_TABLE[player_local]:
+            status = status.copy()
+            status[board_idx] = player
+            self.board_status = status
+            self._decided |= 1 << board_idx
+            # Only the mover can complete a meta line, and only right now.
+            meta = 0
+            for k in range(9):
+                if status[k] == player:
+                    meta |= 1 << k
+            if _WIN_TABLE[meta]:
+                self._winner = player
+        elif ((self.x_bb | self.o_bb) >> shift) & _LOCAL_MASK == _LOCAL_MASK:
+            status = status.copy()
+            status[board_idx] = 2  # local draw
+            self.board_status = status
+            self._decided |= 1 << board_idx
 
         # Determine forced board for the next player --------------------- #
-        next_forced: Optional[int] = cell_idx
-        # Add temporary variable to satisfy mypy about potential None index
-        check_board_idx = next_forced
-        if check_board_idx is not None and new_status[check_board_idx] != 0:
-            next_forced = None  # free move if target board decided
-
-        return SudoTicTacToeState(
-            boards=new_boards,
-            board_status=new_status,
-            current_player=-self._current_player,
-            forced_board=next_forced,
+        # Free move if the target board is decided.
+        old_forced = self.forced_board
+        self.forced_board = None if (self._decided >> cell_idx) & 1 else cell_idx
+        self._current_player = -player
+        self._zhash = (
+            zhash
+            ^ _ZOBRIST_PLAYER
+            ^ _ZOBRIST_FORCED[9 if old_forced is None else old_forced]
+            ^ _ZOBRIST_FORCED[9 if self.forced_board is None else self.forced_board]
         )
+        self._cached_legal = None
+        self._canonical = None
+
+    def move_order_key(self, action: SudoAction) -> int:
+        """Prefer moves that win a local board, then strong cells.
+
+        A cell's weight is the number of lines through it; it also decides
+        the board the opponent is sent to.
+        """
+        board_idx, cell_idx = action
+        mine = self.x_bb if self._current_player == 1 else self.o_bb
+        local = ((mine >> (9 * board_idx)) & _LOCAL_MASK) | (1 << cell_idx)
+        return 8 * _WIN_TABLE[local] + _CELL_LINES[cell_idx]
 
     # --- UPDATED terminal checks --- #
     def is_game_over(self) -> bool:
         """Return `True` if the game is over (meta-win or draw)."""
-        # Check for a win on the meta-board
-        if _is_meta_win(self.board_status, 1) or _is_meta_win(self.board_status, -1):
-            return True
-        # Check if all local boards are decided (overall draw)
-        if all(status != 0 for status in self.board_status):
-            return True
-        return False
+        # Both flags are maintained incrementally by `_play`.
+        return self._winner != 0 or self._decided == _LOCAL_MASK
 
     # --- UPDATED game result --- #
     def game_result(self) -> int:
         """Outcome based on meta-board: 1 (X win), -1 (O win), 0 (draw/unfinished)."""
-        if _is_meta_win(self.board_status, 1):
-            return 1 # X wins the meta-game
-        if _is_meta_win(self.board_status, -1):
-            return -1 # O wins the meta-game
-        if all(status != 0 for status in self.board_status):
-            return 0  # Draw (all boards decided, no meta-win)
-        return 0 # Game is unfinished
+        return self._winner
+
+    def game_status(self) -> Optional[int]:
+        """Meta-board winner, 0 once every board is decided, else None."""
+        if self._winner != 0:
+            return self._winner
+        return 0 if self._decided == _LOCAL_MASK else None
+
+    # --- native simulation ---------------------------------------------- #
+    @classmethod
+    def seed_rng(cls, seed: int) -> None:
+        """Seed the NumPy rollout generator and, if present, the Numba kernel's."""
+        _NP_RNG.bit_generator.state = np.random.default_rng(seed).bit_generator.state
+        if _numba_seed is not None:
+            _numba_seed(seed)
+
+    def fast_rollout(self) -> Optional[int]:
+        """Play a uniformly random game to the end in compiled code.
+
+        Uses the `_sudottt` C extension if it has been built, else Numba.
+        Returns None when neither is available.
+        """
+        if _sudottt is None and _numba_rollout_from is None:
+            return None
+        if self.is_game_over():
+            return self.game_result()
+        forced = self.forced_board
+        if forced is None or self.board_status[forced] != 0:
+            forced = -1
+        if _sudottt is not None:
+            return _sudottt.rollout_from(self.x_bb, self.o_bb, self.board_status, forced,
+                                         self._current_player, random.getrandbits(64))
+        x_bb, o_bb = self.x_bb, self.o_bb
+        x = np.array([(x_bb >> (9 * b)) & _LOCAL_MASK for b in range(9)], dtype=np.int64)
+        o = np.array([(o_bb >> (9 * b)) & _LOCAL_MASK for b in range(9)], dtype=np.int64)
+        status = np.array(self.board_status, dtype=np.int8)
+        return int(_numba_rollout_from(x, o, status, forced, self._current_player, _WIN_TABLE_U8))
+
+    # --- batched simulation -------------------------------------------- #
+    @classmethod
+    def rollout_batch(cls, states: Sequence[GameState]) -> np.ndarray:
+        """Play a uniformly random game from each state with `batch_rollout`."""
+        return batch_rollout(cast(Sequence[SudoTicTacToeState], states))
+
+    def vectorized_rollout(self, batch: int = 128) -> np.ndarray:
+        """Return the results of *batch* independent random playouts from here."""
+        return batch_rollout([self] * batch)
 
     # --- display -------------------------------------------------------- #
     def __str__(self) -> str:  # pragma: no cover
-        symbols = {1: "X", -1: "O"}
-        rows: List[str] = []
-        separator = "-------+-------+-------" # Adjusted separator length
-        header = " B {} | B {} | B {} " # Adjusted header spacing
-
-        for big_row in range(3):
-            rows.append(header.format(3 * big_row, 3 * big_row + 1, 3 * big_row + 2))
-            for small_row in range(3):
-                parts: List[str] = []
-                for big_col in range(3):
-                    b_idx = 3 * big_row + big_col
-                    start = 3 * small_row
-                    # Use index for empty cells
-                    cells = [
-                        symbols.get(self.boards[b_idx][start + i], str(start + i))
-                        for i in range(3)
-                    ]
-                    parts.append(" ".join(cells)) # Ensure space between cell numbers/symbols
-                rows.append(" | ".join(parts)) # Ensure space around separators
-            if big_row < 2:
-                rows.append(separator)
-        return "\n".join(rows)
+        # Fill the marks into the empty-board text, visiting set bits only.
+        text = bytearray(_STR_TEMPLATE)
+        x_bb = self.x_bb
+        occupied = x_bb | self.o_bb
+        while occupied:
+            low = occupied & -occupied
+            text[_STR_OFFSETS[low.bit_length() - 1]] = 88 if x_bb & low else 79 # "X" / "O"
+            occupied ^= low
+        return text.decode("ascii")
 
     # --- hashing / equality -------------------------------------------- #
     def __hash__(self) -> int:  # pragma: no cover
-        return hash(
-            (
-                tuple(tuple(board) for board in self.boards),
-                tuple(self.board_status),
-                self._current_player,
-                self.forced_board,
+        return self._zhash
+
+    def canonical_key(self) -> int:
+        """Return a hash shared by this position and its symmetric images."""
+        if self._canonical is None:
+            self._canonical = _canonical_zobrist(
+                self.x_bb, self.o_bb, self._current_player, self.forced_board
             )
-        )
+        return self._canonical
 
     def __eq__(self, other: object) -> bool:  # pragma: no cover
         if not isinstance(other, SudoTicTacToeState):
             return False
+        # Different hashes settle most comparisons with one int compare. The
+        # board status follows from the bitboards, so it need not be compared.
         return (
-            self.boards == other.boards
-            and self.board_status == other.board_status
+            self._zhash == other._zhash
+            and self.x_bb == other.x_bb
+            and self.o_bb == other.o_bb
             and self._current_player == other._current_player
             and self.forced_board == other.forced_board
         )
@@ -273,3 +573,114 @@ class SudoTicTacToeState(GameState):
         if not isinstance(action, tuple) or len(action) != 2:
             return f"Invalid SudoAction format: {action}"
         return f"board {action[0]}, cell {action[1]}"
+
+
+# ----------------------------------------------------------------------- #
+#                      Batched random playouts                            #
+# ----------------------------------------------------------------------- #
+
+_WIN_TABLE_NP = np.frombuffer(_WIN_TABLE, dtype=np.uint8).astype(bool)
+_WIN_TABLE_U8 = _WIN_TABLE_NP.astype(np.uint8) # writable copy for the Numba kernel
+# One PCG64 generator for all batched playouts: it fills each ply's random
+# numbers for the whole batch in one call, faster than the legacy global one.
+_NP_RNG = np.random.default_rng()
+_BIT_INDEX = np.arange(9, dtype=np.uint16)
+_BIT_WEIGHTS = np.left_shift(1, np.arange(9)).astype(np.int64)
+
+
+def _pack_states(states: Sequence[SudoTicTacToeState], mask_dtype: Any) -> Tuple[np.ndarray, ...]:
+    """Unpack states into per-game arrays for the batched rollouts.
+
+    Returns `(results, idx, x, o, status, forced, player)`: *results* holds
+    the outcome of games that are already over, and the remaining arrays
+    describe the unfinished games, whose positions in *states* are *idx*.
+    A forced board of -1 means a free move.
+    """
+    n = len(states)
+    results = np.zeros(n, dtype=np.int8)
+    x = np.empty((n, 9), dtype=mask_dtype)
+    o = np.empty((n, 9), dtype=mask_dtype)
+    status = np.empty((n, 9), dtype=np.int8)
+    forced = np.empty(n, dtype=np.int64)
+    player = np.empty(n, dtype=np.int8)
+    live = np.ones(n, dtype=bool)
+    for i, state in enumerate(states):
+        if state.is_game_over():
+            results[i] = state.game_result()
+            live[i] = False
+            continue
+        for b in range(9):
+            x[i, b] = (state.x_bb >> (9 * b)) & _LOCAL_MASK
+            o[i, b] = (state.o_bb >> (9 * b)) & _LOCAL_MASK
+        status[i] = state.board_status
+        fb = state.forced_board
+        forced[i] = fb if fb is not None and state.board_status[fb] == 0 else -1
+        player[i] = state.current_player
+    idx = np.flatnonzero(live)
+    return results, idx, x[idx], o[idx], status[idx], forced[idx], player[idx]
+
+
+def batch_rollout(states: Sequence[SudoTicTacToeState]) -> np.ndarray:
+    """Play one uniformly random game to the end from each of *states*.
+
+    All games advance in lockstep as NumPy arrays (per-board X/O masks,
+    board status, forced board and player to move), so the interpreter cost
+    of a ply is paid once for the whole batch rather than once per game.
+    Moves are drawn with the module's `np.random.Generator`. When Numba is
+    installed the games are played by a compiled kernel instead.
+
+    Returns:
+        An `int8` array with the result of each game from X's perspective.
+    """
+    if _numba_rollout_batch is not None:
+        # Compiled kernel: one native loop per game, spread over threads.
+        results, idx, x, o, status, forced, player = _pack_states(states, np.int64)
+        if idx.size:
+            results[idx] = _numba_rollout_batch(x, o, status, forced, player, _WIN_TABLE_U8)
+        return results
+
+    results, idx, x, o, status, forced, player = _pack_states(states, np.uint16)
+    rng = _NP_RNG
+
+    while idx.size:
+        rows = np.arange(idx.size)
+
+        # Playable boards: the forced one if any, else every undecided board.
+        playable = status == 0
+        has_forced = forced >= 0
+        playable[has_forced] = False
+        playable[has_forced, forced[has_forced]] = True
+        free = np.where(playable, ~(x | o) & _LOCAL_MASK, 0).astype(np.uint16)
+        cells = ((free[:, :, None] >> _BIT_INDEX) & 1).reshape(-1, 81)
+
+        # Uniform choice among each game's legal cells.
+        counts = cells.sum(axis=1)
+        target = (rng.random(idx.size) * counts).astype(np.int64)
+        pick = (cells.cumsum(axis=1) > target[:, None]).argmax(axis=1)
+        board, cell = pick // 9, pick % 9
+        bit = np.left_shift(1, cell).astype(np.uint16)
+
+        is_x = player == 1
+        x[rows[is_x], board[is_x]] |= bit[is_x]
+        o[rows[~is_x], board[~is_x]] |= bit[~is_x]
+
+        # Decide the local board that was played in.
+        x_local, o_local = x[rows, board], o[rows, board]
+        won = _WIN_TABLE_NP[np.where(is_x, x_local, o_local)]
+        full = (x_local | o_local) == _LOCAL_MASK
+        status[rows, board] = np.where(won, player, np.where(full, 2, 0))
+
+        # Only the mover can complete a meta line, and only by winning a board.
+        meta = ((status == player[:, None]) * _BIT_WEIGHTS).sum(axis=1)
+        meta_win = won & _WIN_TABLE_NP[meta]
+        finished = meta_win | (status != 0).all(axis=1)
+        results[idx[finished]] = np.where(meta_win, player, 0)[finished]
+
+        forced = np.where(status[rows, cell] == 0, cell, -1)
+        player = -player
+
+        keep = ~finished
+        idx = idx[keep]
+        x, o, status, forced, player = x[keep], o[keep], status[keep], forced[keep], player[keep]
+
+    return results
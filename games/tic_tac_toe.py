@@ -1,10 +1,15 @@
 from __future__ import annotations
-import copy
+import random
 from typing import List, Optional, Tuple, Any
 
 # Use relative import since game_state is now in the same directory
 from .game_state import GameState
 
+try: # optional C extension, see _tictactoe.pyx for the build command
+    from . import _tictactoe
+except ImportError:
+    _tictactoe = None
+
 # Action for Tic-Tac-Toe is now a tuple containing the cell index
 TttAction = Tuple[int]
 
@@ -15,32 +20,95 @@ _WIN_LINES_TTT: Tuple[Tuple[int, int, int], ...] = (
     (0, 4, 8), (2, 4, 6),             # diagonals
 )
 
+# A position is stored as one 9-bit mask per player (bit i = cell i), which
+# turns the win, draw and legal-move tests below into table lookups.
+_FULL = 0x1FF
+
+# `_WIN_TABLE[mask]` is 1 iff the 9-bit *mask* of one player contains a line.
+_WIN_TABLE: bytes = bytes(
+    1 if any(all((mask >> i) & 1 for i in line) for line in _WIN_LINES_TTT) else 0
+    for mask in range(512)
+)
+
+# One shared action tuple per cell, so states and search nodes all point to
+# the same nine objects instead of allocating a tuple per move.
+_ACTIONS: Tuple[TttAction, ...] = tuple((i,) for i in range(9))
+
+# `_FREE_ACTIONS[free]` lists the actions for the set bits of the mask *free*.
+_FREE_ACTIONS: Tuple[Tuple[TttAction, ...], ...] = tuple(
+    tuple(_ACTIONS[i] for i in range(9) if (free >> i) & 1) for free in range(512)
+)
+
+# Number of winning lines through each cell, used to order moves.
+_CELL_PRIORITY: Tuple[int, ...] = (3, 2, 3, 2, 4, 2, 3, 2, 3)
+
+# Zobrist keys: a state's hash is the XOR of the keys of its X and O cells
+# and, if O is to move, _ZOBRIST_PLAYER, so a move updates it with two XORs.
+_zobrist_rng = random.Random(0x777)  # fixed seed: hashes are stable across runs
+_ZOBRIST_X: Tuple[int, ...] = tuple(_zobrist_rng.getrandbits(64) for _ in range(9))
+_ZOBRIST_O: Tuple[int, ...] = tuple(_zobrist_rng.getrandbits(64) for _ in range(9))
+_ZOBRIST_PLAYER: int = _zobrist_rng.getrandbits(64)
+del _zobrist_rng
+
+
+def _zobrist(x_bb: int, o_bb: int, current_player: int) -> int:
+    """Compute the Zobrist hash of a position from scratch."""
+    h = _ZOBRIST_PLAYER if current_player == -1 else 0
+    for i in range(9):
+        if (x_bb >> i) & 1:
+            h ^= _ZOBRIST_X[i]
+        elif (o_bb >> i) & 1:
+            h ^= _ZOBRIST_O[i]
+    return h
+
 class TicTacToeState(GameState):
     """Represents the state of a standard Tic-Tac-Toe game.
 
     Action is represented as Tuple[int].
     """
-    __slots__ = ("board", "_current_player")
+    __slots__ = ("x_bb", "o_bb", "_current_player", "_status", "_zhash")
 
     # --- GameState required class variables ---
     game_title: str = "Standard Tic-Tac-Toe"
     simulations_per_move: int = 100 # Fewer needed for simple TTT
 
     # --- Instance variables ---
-    board: List[int]  # 0: empty, 1: X, -1: O
+    x_bb: int  # 9-bit mask of X's cells
+    o_bb: int  # 9-bit mask of O's cells
     _current_player: int
+    _status: Optional[int]  # game_status(); states are immutable
+    _zhash: int  # Zobrist hash, updated incrementally by `move`
 
     def __init__(self, board: Optional[List[int]] = None, current_player: int = 1) -> None:
-        self.board = board if board is not None else [0] * 9
+        board = board if board is not None else [0] * 9
         self._current_player = current_player
+        self.x_bb = sum(1 << i for i, cell in enumerate(board) if cell == 1)
+        self.o_bb = sum(1 << i for i, cell in enumerate(board) if cell == -1)
+        if _WIN_TABLE[self.x_bb]:
+            self._status = 1
+        elif _WIN_TABLE[self.o_bb]:
+            self._status = -1
+        else:
+            self._status = 0 if self.x_bb | self.o_bb == _FULL else None
+        self._zhash = _zobrist(self.x_bb, self.o_bb, current_player)
 
     @property
     def current_player(self) -> int:
         return self._current_player
 
-    def available_actions(self) -> List[TttAction]:
-        """Return indices of empty cells, wrapped in tuples."""
-        return [(i,) for i, cell in enumerate(self.board) if cell == 0]
+    @property
+    def board(self) -> List[int]:
+        """The cells as a fresh list (0: empty, 1: X, -1: O), built from the masks."""
+        x_bb, o_bb = self.x_bb, self.o_bb
+        return [1 if (x_bb >> i) & 1 else -1 if (o_bb >> i) & 1 else 0 for i in range(9)]
+
+    def available_actions(self) -> Tuple[TttAction, ...]:
+        """Return indices of empty cells, wrapped in tuples.
+
+        The result is a shared precomputed tuple; callers must not rely on
+        getting a fresh object.
+        """
+        return _FREE_ACTIONS[~(self.x_bb | self.o_bb) & _FULL]
 
     def move(self, action: TttAction) -> TicTacToeState:
         """Place the current player's mark at the cell index from the action tuple."""
@@ -50,50 +118,98 @@ class TicTacToeState(GameState):
 
         if not (0 <= cell_index <= 8):
              raise ValueError("Action cell index must be between 0 and 8.")
-        if self.board[cell_index] != 0:
+        if (self.x_bb | self.o_bb) >> cell_index & 1:
             raise ValueError("Illegal move: cell already occupied.")
+        return self.move_unchecked(action)
 
-        new_board = self.board.copy()
-        new_board[cell_index] = self.current_player
-        return TicTacToeState(board=new_board, current_player=-self.current_player)
-
-    def _check_win(self) -> int:
-        """Check if a player has won. Returns winning player (1 or -1) or 0."""
-        for player in [1, -1]:
-            if any(all(self.board[i] == player for i in line) for line in _WIN_LINES_TTT):
-                return player
-        return 0
+    def move_unchecked(self, action: TttAction) -> TicTacToeState:
+        """Return the successor for a legal *action*, without validating it."""
+        cell_index = action[0]
+        player = self._current_player
+        # Bypass __init__ so the hash is updated rather than recomputed.
+        new = TicTacToeState.__new__(TicTacToeState)
+        new._current_player = -player
+        bit = 1 << cell_index
+        if player == 1:
+            new.x_bb = mine = self.x_bb | bit
+            new.o_bb = self.o_bb
+            new._zhash = self._zhash ^ _ZOBRIST_X[cell_index] ^ _ZOBRIST_PLAYER
+        else:
+            new.x_bb = self.x_bb
+            new.o_bb = mine = self.o_bb | bit
+            new._zhash = self._zhash ^ _ZOBRIST_O[cell_index] ^ _ZOBRIST_PLAYER
+        # Only the mover can have just completed a line.
+        if _WIN_TABLE[mine]:
+            new._status = player
+        else:
+            new._status = 0 if new.x_bb | new.o_bb == _FULL else None
+        return new
+
+    def skip_move(self) -> TicTacToeState:
+        """Same board, other player to move."""
+        return TicTacToeState(board=self.board, current_player=-self.current_player)
+
+    def book_move(self) -> Optional[TttAction]:
+        """Open in the center; every opening draws, and the center is the strongest practical choice."""
+        return _ACTIONS[4] if not (self.x_bb | self.o_bb) else None
+
+    def move_order_key(self, action: TttAction) -> int:
+        """Prefer the center, then corners, then edges."""
+        return _CELL_PRIORITY[action[0]]
+
+    def fast_rollout(self) -> Optional[int]:
+        """Play a random game to the end with the `_tictactoe` C extension, if built."""
+        if _tictactoe is None:
+            return None
+        if self._status is not None:
+            return self._status
+        return _tictactoe.rollout_from(self.x_bb, self.o_bb, self._current_player, random.getrandbits(64))
+
+    def fast_negamax(self, alpha: float, beta: float, depth: float) -> Optional[float]:
+        """Search this position with the `_tictactoe` C extension, if built."""
+        if _tictactoe is None:
+            return None
+        me, opp = (self.x_bb, self.o_bb) if self._current_player == 1 else (self.o_bb, self.x_bb)
+        # Scores are -1..1, so clamping the window to +-2 loses nothing.
+        return float(_tictactoe.negamax(me, opp, int(max(alpha, -2)), int(min(beta, 2)), int(min(depth, 9))))
+
+    def game_status(self) -> Optional[int]:
+        """Return the winner, 0 for a full board, or None while play continues."""
+        return self._status # kept up to date by __init__ and `move`
 
     def is_game_over(self) -> bool:
         """Game is over if there is a win or the board is full."""
-        return self._check_win() != 0 or all(cell != 0 for cell in self.board)
+        return self._status is not None
 
     def game_result(self) -> int:
         """Return 1 if X won, -1 if O won, 0 for a draw."""
-        winner = self._check_win()
-        if winner != 0:
-            return winner
-        if all(cell != 0 for cell in self.board): # Draw
-            return 0
-        return 0 # Game not finished (technically shouldn't be called if not is_game_over)
+        status = self._status
+        return status if status is not None else 0 # 0 also while the game is unfinished
 
     def __str__(self) -> str:
         """Display board using cell indices 0-8 for empty cells."""
         symbols = {1: "X", -1: "O"}
+        board = self.board
         rows = []
         for i in range(0, 9, 3):
             # Show index for empty cells
-            row_cells = [symbols.get(self.board[j], str(j)) for j in range(i, i + 3)]
+            row_cells = [symbols.get(board[j], str(j)) for j in range(i, i + 3)]
             rows.append(" ".join(row_cells))
         return "\n".join(rows)
 
     def __hash__(self) -> int:
-        return hash((tuple(self.board), self.current_player))
+        return self._zhash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TicTacToeState):
             return False
-        return self.board == other.board and self.current_player == other.current_player
+        # Different hashes settle most comparisons with one int compare.
+        return (
+            self._zhash == other._zhash
+            and self.x_bb == other.x_bb
+            and self.o_bb == other.o_bb
+            and self._current_player == other._current_player
+        )
 
     # --- Optional CLI methods ---
 
@@ -105,7 +221,7 @@ class TicTacToeState(GameState):
             cell_index = int(input_str.strip())
             if not (0 <= cell_index <= 8):
                 raise ValueError("Cell number must be between 0 and 8.")
-            return (cell_index,) # Return as a tuple
+            return _ACTIONS[cell_index] # Return as a tuple
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid input: {e}") from e
 
@@ -14,6 +14,7 @@ from games.sudo_tic_tac_toe import SudoTicTacToeState # Sudo game
 
 from algorithms.search_algorithm import SearchAlgorithm # Base class for search
 from algorithms.mcts import MCTSAlgorithm              # MCTS implementation
+from algorithms.array_mcts import ArrayMCTSAlgorithm   # MCTS on a struct-of-arrays tree
 from algorithms.minimax_search import MinimaxSearch # Updated import path
 
 # SIMULATIONS_PER_MOVE = 400 # REMOVED - Now defined per game state class
@@ -24,13 +25,22 @@ AVAILABLE_GAMES: Dict[str, Type[GameState]] = {
     TicTacToeState.game_title: TicTacToeState,
     SudoTicTacToeState.game_title: SudoTicTacToeState
 }
+# Display name of each registered game class
+GAME_NAME_BY_CLASS: Dict[Type[GameState], str] = {
+    cls: name for name, cls in AVAILABLE_GAMES.items()
+}
 
 # --- Algorithm Registry --- #
 # Uses imported classes from the algorithms package
 AVAILABLE_ALGORITHMS: Dict[str, Type[SearchAlgorithm]] = {
     "MCTS": MCTSAlgorithm,
+    "MCTS (array tree)": ArrayMCTSAlgorithm,
     "Minimax": MinimaxSearch # Value is already correct
 }
+# Display name of each registered algorithm class
+ALGO_NAME_BY_CLASS: Dict[Type[SearchAlgorithm], str] = {
+    cls: name for name, cls in AVAILABLE_ALGORITHMS.items()
+}
 
 def _prompt_human_move(state: GameState) -> Tuple:
     """Ask the user for a move until a valid one is entered for the given game state."""
@@ -106,15 +116,15 @@ def play_cli() -> None:
     """Main CLI loop for playing a selected game against a selected AI algorithm."""
 
     GameStateClass = select_game()
-    game_name = GameStateClass.game_title
+    game_name = GAME_NAME_BY_CLASS[GameStateClass]
     AlgorithmClass = select_algorithm()
-    algo_name = next(name for name, cls in AVAILABLE_ALGORITHMS.items() if cls is AlgorithmClass)
+    algo_name = ALGO_NAME_BY_CLASS[AlgorithmClass]
 
     print(f"\nWelcome to {game_name} playing against {algo_name} AI!")
 
     # Optionally configure algorithm parameters (e.g., depth for BruteForce)
     algo_params = {}
-    if AlgorithmClass is MCTSAlgorithm:
+    if AlgorithmClass in (MCTSAlgorithm, ArrayMCTSAlgorithm):
         # MCTSAlgorithm will use the simulations_per_move from the GameState class by default if not passed
         # We pass it explicitly here based on the selected game
         algo_params['simulations_per_move'] = GameStateClass.simulations_per_move